@@ -1,12 +1,17 @@
+import os
+import select
+import shlex
 import subprocess
 import re
 import threading
 import time
 import subprocess
 from subprocess import CompletedProcess
+from uuid import uuid4
 
 from collections import deque
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from subprocess import PIPE, STDOUT, Popen
@@ -19,6 +24,37 @@ from ..protocol.debug_bridge_protocol import DebugBridgeProtocol
 from ..models.component import Bounds, Point, Size
 from ..models.logcat import LogcatItem
 
+_DUMPSYS_CACHE_TTL = 5.0
+
+_KEYEVENT_BACK = "input keyevent 4"
+_KEYEVENT_ENTER = "input keyevent 66"
+_KEYEVENT_HOME = "input keyevent 3"
+_KEYEVENT_RECENT_TASK = "input keyevent 187"
+_KEYEVENT_MENU = "input keyevent 82"
+_KEYEVENT_POWER = "input keyevent 26"
+
+_SIZE_RE = re.compile(r"(\d+)x(\d+)")
+_VERSION_RE = re.compile(r"versionName=([\d\.]+)")
+_TCP_PORT_RE = re.compile(r"tcp:(\d+)")
+_DISPLAY_ID_RE = re.compile(r"mDisplayId=(\d+)")
+
+
+def _timestamp() -> str:
+    """
+    Format the current local time as 'YYYY-MM-DD_HH-MM-SS'.
+
+    Plain integer formatting of a struct_time; avoids strftime's locale
+    machinery in paths that capture many screenshots.
+
+    Returns:
+        str - The formatted timestamp
+    """
+    t = time.localtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"_{t.tm_hour:02d}-{t.tm_min:02d}-{t.tm_sec:02d}"
+    )
+
 
 class AndroidADB(DebugBridgeProtocol):
     """
@@ -30,10 +66,14 @@ class AndroidADB(DebugBridgeProtocol):
     Attributes:
         _serial: str - The serial number of the Android device
         _adb: str - The ADB command prefix with serial number
+        _adb_argv: tuple[str, ...] - Pre-tokenized adb argv prefix with serial number
+        _shell_argv: tuple[str, ...] - Argv prefix for `adb shell` invocations
         _capture_logcat: bool - Whether to capture logcat output
         _stop_event: threading.Event - Event to stop logcat thread
-        _logcat_queue: deque - Queue to store logcat items
+        _logcat_queue: deque - Ring buffer of raw logcat lines as bytes
         _window_size: Size | None - Cached window size of the device
+        _shell_process: Popen | None - Long-lived `adb shell` process shared by shell()
+        _shell_lock: threading.Lock - Serializes access to the persistent shell
     """
 
     def __init__(
@@ -50,14 +90,20 @@ class AndroidADB(DebugBridgeProtocol):
         self._serial = serial
         self._capture_logcat = capture_logcat
         if not android_home:
-            self._adb = f"adb -s {self._serial} "
+            adb_path = "adb"
         else:
             if android_home.endswith("/"):
                 android_home = android_home[:-1]
-            self._adb = f"{android_home}/platform-tools/adb -s {self._serial} "
+            adb_path = f"{android_home}/platform-tools/adb"
+        self._adb_argv: tuple[str, ...] = (adb_path, "-s", self._serial)
+        self._shell_argv = self._adb_argv + ("shell",)
+        self._adb = " ".join(self._adb_argv) + " "
         self._stop_event = threading.Event()
         self._logcat_queue = deque(maxlen=1000)
         self._window_size: Size | None = None
+        self._shell_process: Popen | None = None
+        self._shell_lock = threading.Lock()
+        self._dumpsys_package_cache: dict[str, tuple[float, str]] = {}
         if capture_logcat:
             threading.Thread(target=self._logcat_thread, daemon=True).start()
 
@@ -71,8 +117,11 @@ class AndroidADB(DebugBridgeProtocol):
         """
         Execute an ADB command and return the result.
 
+        The stored adb argv prefix is extended with the tokenized command and
+        executed directly, without forking an intermediate `/bin/sh`.
+
         Args:
-            command: str - The command to execute
+            command: str - The command to execute, without the adb prefix
             timeout: int - Timeout in milliseconds
             cwd: Path | None - Working directory for the command
             env: Mapping[str, str] | None - Environment variables for the command
@@ -81,17 +130,36 @@ class AndroidADB(DebugBridgeProtocol):
             CompletedProcess - The result of the command execution
         """
         _time = int(timeout / 1000)
-        logger.info(f"Run command: {command}")
+        logger.info(f"Run command: {self._adb}{command}")
         return subprocess.run(
-            command,
+            self._adb_argv + tuple(shlex.split(command)),
             capture_output=True,
             text=True,
-            shell=True,
             timeout=_time,
             cwd=cwd,
             env=env,
         )
 
+    def _adb_fire_and_forget(self, command: str, timeout: int = 30000):
+        """
+        Execute an ADB command whose output is discarded.
+
+        stdout/stderr go to DEVNULL, so no pipes are allocated or drained for
+        commands run purely for their side effect.
+
+        Args:
+            command: str - The command to execute, without the adb prefix
+            timeout: int - Timeout in milliseconds (default: 30000)
+        """
+        _time = int(timeout / 1000)
+        logger.info(f"Run command: {self._adb}{command}")
+        subprocess.run(
+            self._adb_argv + tuple(shlex.split(command)),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=_time,
+        )
+
     def cmd(
         self,
         command: str,
@@ -111,8 +179,49 @@ class AndroidADB(DebugBridgeProtocol):
         Returns:
             CompletedProcess - The result of the command execution
         """
-        _command = self._adb + command
-        return self._adb_popen(_command, timeout, cwd, env)
+        return self._adb_popen(command, timeout, cwd, env)
+
+    def _persistent_shell(self) -> Popen:
+        """
+        Get the long-lived `adb shell` process, starting it lazily on first use.
+
+        Returns:
+            Popen - The persistent shell process with piped stdin/stdout
+        """
+        if self._shell_process is None or self._shell_process.poll() is not None:
+            self._shell_process = Popen(
+                self._shell_argv,
+                stdin=PIPE,
+                stdout=PIPE,
+                stderr=STDOUT,
+                bufsize=0,
+            )
+        return self._shell_process
+
+    def cmd_many(
+        self, commands: list[str], timeout: int = 30000
+    ) -> list[CompletedProcess]:
+        """
+        Execute several independent ADB commands concurrently.
+
+        Dispatches through a thread pool so the host-side fork+exec cost is
+        amortized across cores. Only use this for read-only commands; mutating
+        commands (tap, keyevent, install) must still be serialized by the
+        caller.
+
+        Args:
+            commands: list[str] - The ADB commands to execute
+            timeout: int - Timeout in milliseconds per command (default: 30000)
+
+        Returns:
+            list[CompletedProcess] - Results in the same order as `commands`
+        """
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(commands))) as executor:
+            return list(
+                executor.map(lambda command: self.cmd(command, timeout), commands)
+            )
 
     def shell(
         self,
@@ -124,6 +233,15 @@ class AndroidADB(DebugBridgeProtocol):
         """
         Execute a shell command on the device.
 
+        Commands are written to a persistent `adb shell` session and the output
+        is framed with a sentinel line, so successive calls share one adb
+        process instead of paying fork+exec per command. The session read loop
+        is bounded by `timeout`; on expiry the session is killed and the
+        command falls back to a one-shot adb invocation, as it does when the
+        session is broken. Calls that need `cwd` or `env` go straight to the
+        one-shot path, since those apply to the local adb process and cannot
+        be retrofitted onto the running session.
+
         Args:
             command: str - The shell command to execute
             timeout: int - Timeout in milliseconds (default: 30000)
@@ -133,14 +251,98 @@ class AndroidADB(DebugBridgeProtocol):
         Returns:
             CompletedProcess - The result of the command execution
         """
-        _command = self._adb + "shell " + command
-        return self._adb_popen(_command, timeout, cwd, env)
+        if not command.strip():
+            # An empty command cannot be framed: `; echo <marker>` is a shell
+            # syntax error that never prints the marker, so the call would
+            # burn the whole timeout and kill the session for nothing.
+            return CompletedProcess(
+                args=self._adb + "shell " + command,
+                returncode=0,
+                stdout="",
+                stderr="",
+            )
+        if cwd is not None or env is not None:
+            return self._adb_popen("shell " + command, timeout, cwd, env)
+        token = uuid4().hex
+        marker = f"__HERMES_{token}_"
+        deadline = time.monotonic() + timeout / 1000
+        with self._shell_lock:
+            try:
+                process = self._persistent_shell()
+                logger.info(f"Run shell command: {command}")
+                process.stdin.write(f"{command}; echo {marker}$?__\n".encode())
+                process.stdin.flush()
+                buffer = bytearray()
+                lines = []
+                returncode = None
+                while returncode is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Persistent shell command timed out: {command}"
+                        )
+                    ready, _, _ = select.select([process.stdout], [], [], remaining)
+                    if not ready:
+                        raise TimeoutError(
+                            f"Persistent shell command timed out: {command}"
+                        )
+                    chunk = os.read(process.stdout.fileno(), 65536)
+                    if chunk == b"":
+                        raise BrokenPipeError("Persistent shell closed")
+                    buffer += chunk
+                    start = 0
+                    while (pos := buffer.find(b"\n", start)) != -1:
+                        line = buffer[start : pos + 1].decode(
+                            "utf-8", errors="replace"
+                        )
+                        start = pos + 1
+                        if marker in line:
+                            head, _sep, tail = line.partition(marker)
+                            if head:
+                                lines.append(head)
+                            returncode = int(tail.rstrip().removesuffix("__"))
+                            break
+                        lines.append(line)
+                    del buffer[:start]
+                return CompletedProcess(
+                    args=self._adb + "shell " + command,
+                    returncode=returncode,
+                    stdout="".join(lines),
+                    stderr="",
+                )
+            except (OSError, ValueError) as e:
+                # TimeoutError is an OSError: a hung command also kills the
+                # session, so the lock is never held past the deadline.
+                logger.warning(f"Persistent shell failed: {e}, fallback to one-shot")
+                if self._shell_process:
+                    try:
+                        self._shell_process.kill()
+                    except Exception:
+                        pass
+                    self._shell_process = None
+        return self._adb_popen("shell " + command, timeout, cwd, env)
+
+    def run_batch(self, commands: list[str], timeout: int = 30000) -> CompletedProcess:
+        """
+        Execute several shell commands in a single round-trip.
+
+        The commands are joined with `;` and sent as one shell call, so a
+        choreography of N inputs costs one adb RPC instead of N.
+
+        Args:
+            commands: list[str] - The shell commands to execute in order
+            timeout: int - Timeout in milliseconds (default: 30000)
+
+        Returns:
+            CompletedProcess - The result of the batched execution
+        """
+        return self.shell("; ".join(commands), timeout)
 
     def clear_logcat(self):
         """
         Clear all logcat buffers.
         """
-        self.cmd("logcat -b all -c")
+        self._adb_fire_and_forget("logcat -b all -c")
 
     def stop_logcat(self):
         """
@@ -170,29 +372,23 @@ class AndroidADB(DebugBridgeProtocol):
         This method runs in a separate thread and captures logcat output,
         parsing it into LogcatItem objects and storing them in a queue.
         """
-        cmd = self._adb + "logcat -v year -D"
-        logger.info(f"Start logcat thread: {cmd}")
+        argv = self._adb_argv + ("logcat", "-v", "year", "-D")
+        logger.info(f"Start logcat thread: {' '.join(argv)}")
         while not self._stop_event.is_set():
-            process = Popen(cmd.split(), stdout=PIPE, stderr=STDOUT)
+            process = Popen(argv, stdout=PIPE, stderr=STDOUT, bufsize=0)
+            buffer = bytearray()
             while not self._stop_event.is_set():
-                if process.stdout:
-                    output = process.stdout.readline()
-                    if output == b"" and process.poll() is not None:
+                ready, _, _ = select.select([process.stdout], [], [], 0.5)
+                if ready:
+                    chunk = os.read(process.stdout.fileno(), 65536)
+                    if chunk == b"" and process.poll() is not None:
                         break
-                    if output:
-                        line = output.strip().decode("utf-8", errors="replace")
-                        try:
-                            timestamp = line[:23]
-                            dt = datetime.strptime(
-                                timestamp + "000", "%Y-%m-%d %H:%M:%S.%f"
-                            )
-                            self._logcat_queue.append(
-                                LogcatItem(timestamp=dt, message=line)
-                            )
-                        except ValueError:
-                            logger.error(f"Invalid logcat line: {line}")
-                else:
-                    time.sleep(0.1)
+                    buffer += chunk
+                    start = 0
+                    while (pos := buffer.find(b"\n", start)) != -1:
+                        self._logcat_queue.append(bytes(buffer[start:pos]))
+                        start = pos + 1
+                    del buffer[:start]
                 if process.poll() is not None:
                     break
             try:
@@ -200,6 +396,53 @@ class AndroidADB(DebugBridgeProtocol):
             except Exception as e:
                 logger.error(f"Failed to kill logcat process: {e}")
 
+    def _parse_logcat_item(self, raw: bytes) -> LogcatItem | None:
+        """
+        Parse a single raw logcat line into a LogcatItem.
+
+        The `logcat -v year` timestamp has a fixed layout, so the fields are
+        sliced and converted with integer arithmetic instead of strptime.
+
+        Args:
+            raw: bytes - A single logcat line without the trailing newline
+
+        Returns:
+            LogcatItem | None - The parsed entry, or None for malformed lines
+        """
+        line = raw.strip()
+        try:
+            dt = datetime(
+                int(line[0:4]),
+                int(line[5:7]),
+                int(line[8:10]),
+                int(line[11:13]),
+                int(line[14:16]),
+                int(line[17:19]),
+                int(line[20:23]) * 1000,
+            )
+        except ValueError:
+            logger.error(f"Invalid logcat line: {line.decode('utf-8', errors='replace')}")
+            return None
+        return LogcatItem(
+            timestamp=dt, message=line.decode("utf-8", errors="replace")
+        )
+
+    def iter_logcat(self) -> Iterator[LogcatItem]:
+        """
+        Yield captured logcat entries, parsing lazily on consumption.
+
+        The capture thread queues raw bytes lines; only entries the consumer
+        actually iterates pay the datetime and LogcatItem construction, so
+        lines that age out of the ring buffer cost nothing beyond the append.
+
+        Yields:
+            LogcatItem - Parsed logcat entries in capture order
+        """
+        while self._logcat_queue:
+            item = self._parse_logcat_item(self._logcat_queue.popleft())
+            if item:
+                yield item
+
     def reboot(self, wait_for_boot_completed: bool = True, timeout: int = 60000):
         """
         Reboot the device and optionally wait for boot completion.
@@ -208,7 +451,7 @@ class AndroidADB(DebugBridgeProtocol):
             wait_for_boot_completed: bool - Whether to wait for boot completion
             timeout: int - Timeout in milliseconds for boot completion
         """
-        self.cmd("reboot")
+        self._adb_fire_and_forget("reboot")
         if wait_for_boot_completed:
             self.wait_for_boot_completed(timeout)
 
@@ -226,6 +469,7 @@ class AndroidADB(DebugBridgeProtocol):
         started_at = time.time()
         deadline = started_at + _time
         n = 1
+        delay = 0.1
         while time.time() < deadline:
             try:
                 output = self.shell("getprop sys.boot_completed")
@@ -234,7 +478,8 @@ class AndroidADB(DebugBridgeProtocol):
             except Exception as e:
                 logger.debug(f"Failed to get boot completed: {e}")
             logger.debug(f"Waiting for boot completed...{n}")
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
             n += 1
         return False
 
@@ -248,65 +493,79 @@ class AndroidADB(DebugBridgeProtocol):
         output = self.cmd("devices -l")
         return output.stdout.splitlines()[1:]
 
-    def screenshot(self, path: Path | None, display_id: str | None = None) -> Path:
+    def screenshot(
+        self,
+        path: Path | None,
+        display_id: str | None = None,
+        timeout: int = 30000,
+    ) -> Path:
         """
         Take a screenshot of the device.
 
+        The PNG bytes are streamed from `exec-out screencap -p` directly into
+        the local file, skipping the on-device file write and pull round-trip.
+
         Args:
             path: Path | None - Path to save the screenshot, or None for default path
             display_id: str | None - Display ID to capture, or None for default display
+            timeout: int - Timeout in milliseconds (default: 30000)
 
         Returns:
             Path - Path where the screenshot was saved
+
+        Raises:
+            CalledProcessError - If screencap exits non-zero, so a failed
+                capture is not silently left as a truncated or empty file
         """
+        _time = int(timeout / 1000)
         if path:
             _path = path
         else:
-            _path = (
-                config.CACHE_DIR
-                / f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}-screenshot.png"
-            )
+            _path = config.CACHE_DIR / f"{_timestamp()}-screenshot.png"
+        argv = [*self._adb_argv, "exec-out", "screencap"]
         if display_id:
-            self.cmd(f"exec-out screencap -d {display_id} -p {_path}")
-        else:
-            self.cmd(f"exec-out screencap -p {_path}")
+            argv += ["-d", str(display_id)]
+        argv.append("-p")
+        logger.info(f"Run command: {' '.join(argv)}")
+        with open(_path, "wb") as f:
+            subprocess.run(argv, stdout=f, timeout=_time, check=True)
         return _path
 
     def click_back(self):
         """
         Simulate back button press.
         """
-        self.shell("input keyevent 4")
+        self.shell(_KEYEVENT_BACK)
 
     def click_enter(self):
         """
         Simulate enter key press.
         """
-        self.shell("input keyevent 66")
+        self.shell(_KEYEVENT_ENTER)
 
     def click_home(self):
         """
         Simulate home button press.
         """
-        self.shell("input keyevent 3")
+        self.shell(_KEYEVENT_HOME)
 
     def click_recent_task(self):
         """
         Simulate recent tasks button press.
         """
-        self.shell("input keyevent 187")
+        self.shell(_KEYEVENT_RECENT_TASK)
 
     def click_menu(self):
         """
         Simulate menu button press.
         """
-        self.shell("input keyevent 82")
+        self.shell(_KEYEVENT_MENU)
 
     def click_power(self):
         """
         Simulate power button press.
         """
-        self.shell("input keyevent 26")
+        self.shell(_KEYEVENT_POWER)
 
     def get_window_size(self, refresh: bool = False) -> Size:
         """
@@ -325,13 +584,24 @@ class AndroidADB(DebugBridgeProtocol):
             return self._window_size
         else:
             output = self.shell("wm size")
-            search = re.search(r"\d+x(\d+)", output.stdout)
+            search = _SIZE_RE.search(output.stdout)
             if search:
-                _s = [int(x) for x in search.group().split("x")]
-                self._window_size = Size(width=_s[0], height=_s[1])
+                self._window_size = Size(
+                    width=int(search.group(1)), height=int(search.group(2))
+                )
                 return self._window_size
             raise ValueError("Failed to get window size")
 
+    def invalidate_window_size(self):
+        """
+        Drop the cached window size.
+
+        Callers that rotate the display should invalidate here so the next
+        get_window_size() re-queries the device instead of reusing stale
+        dimensions.
+        """
+        self._window_size = None
+
     def tap(self, x: int, y: int, offset_x: int = 0, offset_y: int = 0):
         """
         Simulate a tap at the specified coordinates.
@@ -344,6 +614,15 @@ class AndroidADB(DebugBridgeProtocol):
         """
         self.shell(f"input tap {x + offset_x} {y + offset_y}")
 
+    def tap_many(self, points: list[Point]):
+        """
+        Simulate a sequence of taps in a single shell round-trip.
+
+        Args:
+            points: list[Point] - Coordinates to tap, in order
+        """
+        self.run_batch([f"input tap {point.x} {point.y}" for point in points])
+
     def long_press(
         self, x: int, y: int, offset_x: int = 0, offset_y: int = 0, duration: int = 2000
     ):
@@ -390,9 +669,11 @@ class AndroidADB(DebugBridgeProtocol):
             repeat: int - Number of times to repeat the swipe (default: 1)
             wait_render: int - Wait time between swipes in milliseconds (default: 200)
         """
-        for _ in range(repeat):
-            self.shell(f"input swipe {start.x} {start.y} {end.x} {end.y} {duration}")
-            time.sleep(wait_render / 1000)
+        if repeat < 1:
+            return
+        _swipe = f"input swipe {start.x} {start.y} {end.x} {end.y} {duration}"
+        self.shell(f"; sleep {wait_render / 1000}; ".join([_swipe] * repeat))
+        time.sleep(wait_render / 1000)
 
     def swipe_ext(
         self,
@@ -416,36 +697,29 @@ class AndroidADB(DebugBridgeProtocol):
             wait_render: int - Wait time between swipes in milliseconds (default: 200)
         """
         if bounds is None:
-            bounds = Bounds(
-                left=0,
-                top=0,
-                right=self.get_window_size().width,
-                bottom=self.get_window_size().height,
-            )
-        center_x = int(bounds.left + (bounds.right - bounds.left) / 2)
-        center_y = int(bounds.top + (bounds.bottom - bounds.top) / 2)
+            size = self.get_window_size()
+            bounds = Bounds(left=0, top=0, right=size.width, bottom=size.height)
+        left, top = bounds.left, bounds.top
+        width = bounds.right - left
+        height = bounds.bottom - top
+        center_x = int(left + width / 2)
+        center_y = int(top + height / 2)
         offset_x = int(center_x * scale)
         offset_y = int(center_y * scale)
+        low_x = int(left + width * 0.1)
+        low_y = int(top + height * 0.1)
         if direction == "up":
             start = Point(x=center_x, y=offset_y)
-            end = Point(
-                x=center_x, y=int(bounds.top + (bounds.bottom - bounds.top) * 0.1)
-            )
+            end = Point(x=center_x, y=low_y)
         elif direction == "down":
-            start = Point(
-                x=center_x, y=int(bounds.top + (bounds.bottom - bounds.top) * 0.1)
-            )
+            start = Point(x=center_x, y=low_y)
             end = Point(x=center_x, y=offset_y)
         elif direction == "right":
-            start = Point(
-                x=int(bounds.left + (bounds.right - bounds.left) * 0.1), y=center_y
-            )
+            start = Point(x=low_x, y=center_y)
             end = Point(x=offset_x, y=center_y)
         elif direction == "left":
             start = Point(x=offset_x, y=center_y)
-            end = Point(
-                x=int(bounds.left + (bounds.right - bounds.left) * 0.1), y=center_y
-            )
+            end = Point(x=low_x, y=center_y)
         self.swipe(start, end, duration, repeat, wait_render)
 
     def get_datetime(self) -> str:
@@ -468,6 +742,30 @@ class AndroidADB(DebugBridgeProtocol):
         """
         self.cmd(f"pull {remote_path} {local_path}")
 
+    def pull_many(self, remote_to_local: Mapping[str, Path]):
+        """
+        Pull several files from the device, batching transfers per directory.
+
+        Remote files whose destination is `<dir>/<remote basename>` are pulled
+        with a single `adb pull r1 r2 ... <dir>` invocation, so a directory of
+        small artifacts costs one process instead of one per file. Renamed
+        destinations fall back to individual pulls.
+
+        Args:
+            remote_to_local: Mapping[str, Path] - Remote paths mapped to local destinations
+        """
+        grouped: dict[Path, list[str]] = {}
+        singles: dict[str, Path] = {}
+        for remote_path, local_path in remote_to_local.items():
+            if local_path.name == remote_path.rsplit("/", 1)[-1]:
+                grouped.setdefault(local_path.parent, []).append(remote_path)
+            else:
+                singles[remote_path] = local_path
+        for directory, remote_paths in grouped.items():
+            self.cmd(f"pull {' '.join(remote_paths)} {directory}")
+        for remote_path, local_path in singles.items():
+            self.pull(remote_path, local_path)
+
     def push(self, remote_path: str, local_path: Path):
         """
         Push a file from the local system to the device.
@@ -510,6 +808,33 @@ class AndroidADB(DebugBridgeProtocol):
             self.shell(f"am start -n {package_name}")
         time.sleep(1)
 
+    def start_app_and_wait(
+        self,
+        package_name: str,
+        activity_name: str | None = None,
+        timeout: int = 15000,
+    ) -> bool:
+        """
+        Start an app and block until the launch completes.
+
+        Uses `am start -W`, which returns once the activity is drawn, so the
+        wait is bounded by the actual launch instead of wall-clock polling.
+
+        Args:
+            package_name: str - Name of the package to start
+            activity_name: str | None - Name of the activity to start (optional)
+            timeout: int - Timeout in milliseconds (default: 15000)
+
+        Returns:
+            bool - True if the synchronous launch completed, False otherwise
+        """
+        if activity_name:
+            target = f"{package_name}/{activity_name}"
+        else:
+            target = package_name
+        completed_process = self.shell(f"am start -W -n {target}", timeout)
+        return "TotalTime" in completed_process.stdout
+
     def stop_app(self, package_name: str):
         """
         Stop an app on the device.
@@ -519,31 +844,64 @@ class AndroidADB(DebugBridgeProtocol):
         """
         self.shell(f"am force-stop {package_name}")
 
-    def get_app_info(self, package_name: str) -> str:
+    def _dumpsys_package(self, package_name: str, refresh: bool = False) -> str:
         """
-        Get information about an app.
+        Get the `dumpsys package` blob for a package, with a short-lived cache.
+
+        The dump is often >100 KB, so callers that need several fields within
+        a short window share one device round-trip instead of re-dumping.
 
         Args:
             package_name: str - Name of the package
+            refresh: bool - Whether to bypass the cached dump
 
         Returns:
-            str - App information
+            str - The raw dumpsys output
         """
+        cached = self._dumpsys_package_cache.get(package_name)
+        if not refresh and cached and time.time() - cached[0] < _DUMPSYS_CACHE_TTL:
+            return cached[1]
         output = self.shell(f"dumpsys package {package_name}")
+        self._dumpsys_package_cache[package_name] = (time.time(), output.stdout)
         return output.stdout
 
-    def get_app_version(self, package_name: str):
+    def get_app_info(self, package_name: str, refresh: bool = False) -> str:
+        """
+        Get information about an app.
+
+        Args:
+            package_name: str - Name of the package
+            refresh: bool - Whether to bypass the cached dumpsys output
+
+        Returns:
+            str - App information
+        """
+        return self._dumpsys_package(package_name, refresh)
+
+    def get_app_version(self, package_name: str, refresh: bool = False):
         """
         Get the version of an app.
 
+        When no fresh dump is cached, the versionName line is filtered on the
+        device so only a few bytes cross the transport instead of the full
+        multi-hundred-KB package dump.
+
         Args:
             package_name: str - Name of the package
+            refresh: bool - Whether to bypass the cached dumpsys output
 
         Returns:
             str | None - Version name if found, None otherwise
         """
-        output = self.shell(f"dumpsys package {package_name}")
-        search = re.search(r"versionName=([\d\.]+)", output.stdout)
+        cached = self._dumpsys_package_cache.get(package_name)
+        if not refresh and cached and time.time() - cached[0] < _DUMPSYS_CACHE_TTL:
+            source = cached[1]
+        else:
+            output = self.shell(
+                f"dumpsys package {package_name} | grep versionName | head -n1"
+            )
+            source = output.stdout
+        search = _VERSION_RE.search(source)
         if search:
             return search.group(1)
         return None
@@ -619,7 +977,7 @@ class AndroidADB(DebugBridgeProtocol):
         lines = output.stdout.splitlines()
         ports = []
         for line in lines:
-            search = re.search(r"tcp:(\d+)", line)
+            search = _TCP_PORT_RE.search(line)
             if search:
                 ports.append(int(search.group(1)))
         return ports
@@ -635,7 +993,7 @@ class AndroidADB(DebugBridgeProtocol):
             ValueError - If getting display IDs fails
         """
         output = self.shell("dumpsys display | grep mDisplayId")
-        search = re.findall(r"mDisplayId=(\d+)", output.stdout)
+        search = _DISPLAY_ID_RE.findall(output.stdout)
         if search:
             return [int(id) for id in search]
         raise ValueError("Failed to get display id")
@@ -1,24 +1,165 @@
+import re
 import time
 
 from collections.abc import Sequence
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import elementpath
 import cv2
+import numpy as np
 
-from xml.etree import ElementTree
+from lxml import etree as ElementTree
 
 from ..models.language import Language
-from .._core import config, portal_http
+from .._core import config
 from .._core.portal_protocol import PortalHTTP
 from ..protocol.component_protocol import ComponentProtocol
+from ..protocol.selector_to_path_protocol import SelectorToPathProtocol
 from ..protocol.debug_bridge_protocol import DebugBridgeProtocol
 from ..models.device import LocatorEngine
 from ..models.component import Bounds, Point, Size
 from ..models.selector import Window, Selector, SelectorKey, Method
 from .selector_to_jsonpath import SelectorToJsonpath
 from .selector_to_xpath import SelectorToXpath
+from ..utils.tools import timestamp
+
+
+_BOUNDS_RE = re.compile(r"(-?\d+),(-?\d+),(-?\d+),(-?\d+)")
+
+# Screenshots are debug cache artifacts; fastest PNG compression wins over
+# the smallest file, and libpng's default level dominates per-shot CPU.
+_PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
+@lru_cache(maxsize=512)
+def compile_xpath(xpath: str) -> elementpath.Selector:
+    """
+    Compile an XPath expression into a reusable elementpath Selector.
+
+    Parsing an XPath string is the expensive part of elementpath.select;
+    distinct expressions are compiled once and reused across locator calls.
+
+    This is the fallback engine behind evaluate_xpath, handling the XPath
+    2.0 functions (ends-with, matches) that libxml2's XPath 1.0 evaluator
+    cannot run.
+
+    Args:
+        xpath: XPath expression to compile
+
+    Returns:
+        elementpath.Selector: Precompiled selector for the expression
+    """
+    return elementpath.Selector(xpath)
+
+
+# Expressions that libxml2 rejected at compile or evaluation time (XPath 2.0
+# functions such as ends-with/matches); these go straight to elementpath.
+_ELEMENTPATH_ONLY: set[str] = set()
+
+
+@lru_cache(maxsize=512)
+def _compile_lxml_xpath(xpath: str) -> ElementTree.XPath:
+    return ElementTree.XPath(xpath)
+
+
+def evaluate_xpath(node: ElementTree._Element, xpath: str) -> list:
+    """
+    Evaluate an XPath expression, preferring lxml's C engine.
+
+    libxml2 evaluates XPath 1.0 expressions several times faster than the
+    pure-Python elementpath engine, but cannot run the XPath 2.0 functions
+    SelectorToXpath emits for fuzzy matching. Those fail on first use, are
+    remembered, and route through elementpath from then on.
+
+    Args:
+        node: Element to evaluate the expression against
+        xpath: XPath expression
+
+    Returns:
+        list: Matching nodes in document order
+    """
+    if xpath not in _ELEMENTPATH_ONLY:
+        try:
+            return _compile_lxml_xpath(xpath)(node)
+        except ElementTree.XPathError:
+            _ELEMENTPATH_ONLY.add(xpath)
+    return compile_xpath(xpath).select(node)
+
+
+def _anchor_to_context(xpath: str) -> str:
+    """
+    Anchor a descendant expression to the context element.
+
+    lxml evaluates "//" from the document root even when invoked on a
+    sub-node, while elementpath treats the passed node as the root; without
+    the "." prefix a component lookup on the lxml path would escape the
+    component subtree and match anywhere on the page.
+
+    Args:
+        xpath: XPath expression as emitted by the selector engine
+
+    Returns:
+        str: Expression scoped to the context element on both engines
+    """
+    return "." + xpath if xpath.startswith("//") else xpath
+
+
+def _iter_attr_matches(node: ElementTree._Element, attr: str, value: str):
+    """
+    Yield descendants of node whose attribute equals value.
+
+    Selectors are overwhelmingly //*[@attr="value"] shapes; a direct tree
+    walk with a C-level attribute compare skips the per-node predicate
+    interpretation a general XPath engine pays. Complex expressions still go
+    through elementpath.
+
+    Args:
+        node: Subtree root to search under
+        attr: Attribute name to compare
+        value: Attribute value to match exactly
+    """
+    for element in node.iter():
+        if element.get(attr) == value:
+            yield element
+
+
+@lru_cache(maxsize=1024)
+def _cached_engine(
+    engine_cls: type[SelectorToPathProtocol],
+    selector: Selector,
+    language: Language,
+    combination: tuple[SelectorKey, ...] | None,
+) -> SelectorToPathProtocol:
+    return engine_cls(selector, language, combination)
+
+
+def build_engine(
+    engine_cls: type[SelectorToPathProtocol],
+    selector: Selector,
+    language: Language,
+    combination: Sequence[SelectorKey] | None = None,
+) -> SelectorToPathProtocol:
+    """
+    Build or reuse a selector engine for the given criteria.
+
+    Engines are immutable after construction but were rebuilt on every
+    locator call, re-paying selector validation and syntax generation; they
+    are memoized here keyed by (engine class, selector, language,
+    combination). Selector models are frozen, which makes them hashable.
+
+    Args:
+        engine_cls: Selector engine class (SelectorToXpath or SelectorToJsonpath)
+        selector: Selector object containing UI element criteria
+        language: Language for localization
+        combination: Optional sequence of SelectorKey to use in combination
+
+    Returns:
+        SelectorToPathProtocol: Cached engine instance for the criteria
+    """
+    if combination is not None:
+        combination = tuple(combination)
+    return _cached_engine(engine_cls, selector, language, combination)
 
 
 class AndroidComponent(ComponentProtocol):
@@ -35,6 +176,7 @@ class AndroidComponent(ComponentProtocol):
         _token: Token for the component
         _tag: Tag for the component
         _adb: ADB interface for device communication
+        _portal: Portal HTTP client bound to the owning device
         _language: Language setting for the component
         _window: Window containing the component
         _timeout: Timeout for component operations
@@ -44,14 +186,32 @@ class AndroidComponent(ComponentProtocol):
         _center: Center point of the component
     """
 
+    __slots__ = (
+        "_parent_syntax",
+        "_locator_engine",
+        "_locator_engine_type",
+        "_token",
+        "_tag",
+        "_adb",
+        "_portal",
+        "_language",
+        "_window",
+        "_timeout",
+        "_node",
+        "_bounds_cache",
+        "_size_cache",
+        "_center_cache",
+    )
+
     def __init__(
         self,
-        node: ElementTree.Element,
+        node: ElementTree._Element,
         parent_syntax: str,
         locator_engine: LocatorEngine,
         token: str,
         tag: str,
         adb: DebugBridgeProtocol,
+        portal: PortalHTTP,
         language: Language,
         timeout: int,
         window: Window,
@@ -66,6 +226,7 @@ class AndroidComponent(ComponentProtocol):
             token: Token for the component
             tag: Tag for the component
             adb: ADB interface for device communication
+            portal: Portal HTTP client bound to the owning device
             language: Language setting for the component
             timeout: Timeout for component operations
             window: Window containing the component
@@ -80,35 +241,60 @@ class AndroidComponent(ComponentProtocol):
         self._token = token
         self._tag = tag
         self._adb = adb
+        self._portal = portal
         self._language = language
         self._window = window
         self._timeout = timeout
         self._node = node
-        self._bounds = self._convert_bounds()
-        self._size = Size(
-            width=self._bounds.right - self._bounds.left,
-            height=self._bounds.bottom - self._bounds.top,
-        )
-        self._center = Point(
-            x=int(self._bounds.left + self._size.width / 2),
-            y=int(self._bounds.top + self._size.height / 2),
-        )
+        self._bounds_cache: Bounds | None = None
+        self._size_cache: Size | None = None
+        self._center_cache: Point | None = None
+
+    @property
+    def _bounds(self) -> Bounds:
+        """
+        Parse the bounds string into a Bounds object, cached on first access.
+
+        Geometry stays lazy because locators() builds a wrapper per matched
+        node while only a few ever get tapped or measured; the cache lives in
+        a dedicated slot since __slots__ rules out cached_property.
+        """
+        if self._bounds_cache is None:
+            match = _BOUNDS_RE.match(self._node.get("bounds") or "0,0,0,0")
+            if match is None:
+                left = top = right = bottom = 0
+            else:
+                left, top, right, bottom = map(int, match.groups())
+            self._bounds_cache = Bounds(
+                left=left, top=top, right=right, bottom=bottom
+            )
+        return self._bounds_cache
 
-    def _convert_bounds(self) -> Bounds:
+    @property
+    def _size(self) -> Size:
+        """
+        Derive the component size from its bounds, cached on first access.
         """
-        Convert the bounds string from the component to a Bounds object.
+        if self._size_cache is None:
+            bounds = self._bounds
+            self._size_cache = Size(
+                width=bounds.right - bounds.left,
+                height=bounds.bottom - bounds.top,
+            )
+        return self._size_cache
 
-        Returns:
-            Bounds: A Bounds object representing the component's boundaries
-        """
-        _bounds = self._node.get("bounds", "0,0,0,0")
-        left, top, right, bottom = _bounds.split(",")
-        return Bounds(
-            left=int(left),
-            top=int(top),
-            right=int(right),
-            bottom=int(bottom),
-        )
+    @property
+    def _center(self) -> Point:
+        """
+        Derive the component center from its bounds, cached on first access.
+        """
+        if self._center_cache is None:
+            bounds = self._bounds
+            self._center_cache = Point(
+                x=int(bounds.left + (bounds.right - bounds.left) / 2),
+                y=int(bounds.top + (bounds.bottom - bounds.top) / 2),
+            )
+        return self._center_cache
 
     def get_window(self) -> Window | None:
         """
@@ -171,8 +357,9 @@ class AndroidComponent(ComponentProtocol):
         Args:
             wait_render: Time to wait after tapping (in milliseconds)
         """
-        portal_http.action_tap(self._window.display_id, self._center)
-        time.sleep(wait_render / 1000)
+        self._portal.action_tap(self._window.display_id, self._center)
+        if wait_render > 0:
+            time.sleep(wait_render / 1000)
 
     def long_press(self, duration: int = 2000, wait_render: int = 1000):
         """
@@ -182,10 +369,11 @@ class AndroidComponent(ComponentProtocol):
             duration: Duration of the long press (in milliseconds)
             wait_render: Time to wait after long pressing (in milliseconds)
         """
-        portal_http.action_long_press(
+        self._portal.action_long_press(
             self._window.display_id, self._center, duration=duration
         )
-        time.sleep(wait_render / 1000)
+        if wait_render > 0:
+            time.sleep(wait_render / 1000)
 
     def locator(
         self,
@@ -211,20 +399,31 @@ class AndroidComponent(ComponentProtocol):
         """
         if language is None:
             language = self._language
-        _engine = self._locator_engine(selector, language, combination)
+        _engine = build_engine(self._locator_engine, selector, language, combination)
         if _engine.get_method() == Method.IMAGE:
             raise NotImplementedError("Image is not implemented")
         elif _engine.get_method() == Method.XPATH:
-            elements = elementpath.select(self._node, _engine.get_syntax())
-            if not elements:
+            if fast_key := _engine.get_fast_key():
+                first = next(_iter_attr_matches(self._node, *fast_key), None)
+            else:
+                first = next(
+                    iter(
+                        evaluate_xpath(
+                            self._node, _anchor_to_context(_engine.get_syntax())
+                        )
+                    ),
+                    None,
+                )
+            if first is None:
                 raise ValueError(f"Invalid {_engine.get_method().value} selector")
             return AndroidComponent(
-                node=elements[0],
+                node=first,
                 parent_syntax=self._parent_syntax,
                 locator_engine=self._locator_engine_type,
                 token=self._token,
                 tag=self._tag,
                 adb=self._adb,
+                portal=self._portal,
                 language=language,
                 timeout=self._timeout,
                 window=self._window,
@@ -258,27 +457,30 @@ class AndroidComponent(ComponentProtocol):
         """
         if language is None:
             language = self._language
-        _engine = self._locator_engine(selector, language, combination)
+        _engine = build_engine(self._locator_engine, selector, language, combination)
         if _engine.get_method() == Method.IMAGE:
             raise NotImplementedError("Image is not implemented")
         elif _engine.get_method() == Method.XPATH:
-            elements = elementpath.select(self._node, _engine.get_syntax())
+            if fast_key := _engine.get_fast_key():
+                elements = list(_iter_attr_matches(self._node, *fast_key))
+            else:
+                elements = evaluate_xpath(
+                    self._node, _anchor_to_context(_engine.get_syntax())
+                )
             if not elements:
                 raise ValueError(f"Invalid {_engine.get_method().value} selector")
-            return [
-                AndroidComponent(
-                    node=ele,
-                    parent_syntax=self._parent_syntax,
-                    locator_engine=self._locator_engine_type,
-                    token=self._token,
-                    tag=self._tag,
-                    adb=self._adb,
-                    language=language,
-                    timeout=self._timeout,
-                    window=self._window,
-                )
-                for ele in elements
-            ]
+            shared = dict(
+                parent_syntax=self._parent_syntax,
+                locator_engine=self._locator_engine_type,
+                token=self._token,
+                tag=self._tag,
+                adb=self._adb,
+                portal=self._portal,
+                language=language,
+                timeout=self._timeout,
+                window=self._window,
+            )
+            return [AndroidComponent(node=ele, **shared) for ele in elements]
         else:
             raise NotImplementedError(
                 f"Locator engine {_engine.get_method().value} is not implemented"
@@ -308,27 +510,30 @@ class AndroidComponent(ComponentProtocol):
         """
         if language is None:
             language = self._language
-        _engine = self._locator_engine(selector, language, combination)
+        _engine = build_engine(self._locator_engine, selector, language, combination)
         if _engine.get_method() == Method.IMAGE:
             raise NotImplementedError("Image is not implemented")
         elif _engine.get_method() == Method.XPATH:
-            elements = elementpath.select(self._node, _engine.get_syntax())
+            if fast_key := _engine.get_fast_key():
+                elements = list(_iter_attr_matches(self._node, *fast_key))
+            else:
+                elements = evaluate_xpath(
+                    self._node, _anchor_to_context(_engine.get_syntax())
+                )
             if not elements:
                 raise ValueError(f"Invalid {_engine.get_method().value} selector")
-            return [
-                AndroidComponent(
-                    node=ele,
-                    parent_syntax=self._parent_syntax,
-                    locator_engine=self._locator_engine_type,
-                    token=self._token,
-                    tag=self._tag,
-                    adb=self._adb,
-                    language=language,
-                    timeout=self._timeout,
-                    window=self._window,
-                )
-                for ele in elements
-            ]
+            shared = dict(
+                parent_syntax=self._parent_syntax,
+                locator_engine=self._locator_engine_type,
+                token=self._token,
+                tag=self._tag,
+                adb=self._adb,
+                portal=self._portal,
+                language=language,
+                timeout=self._timeout,
+                window=self._window,
+            )
+            return [AndroidComponent(node=ele, **shared) for ele in elements]
         else:
             raise NotImplementedError(
                 f"Locator engine {_engine.get_method().value} is not implemented"
@@ -353,7 +558,7 @@ class AndroidComponent(ComponentProtocol):
         Returns:
             bool: True if the component is visible, False otherwise
         """
-        return self._node.get("visible", "") == "true"
+        return self._node.get("visible") == "true"
 
     def is_selected(self) -> bool:
         """
@@ -362,7 +567,7 @@ class AndroidComponent(ComponentProtocol):
         Returns:
             bool: True if the component is selected, False otherwise
         """
-        return self._node.get("selected", "") == "true"
+        return self._node.get("selected") == "true"
 
     def is_enabled(self) -> bool:
         """
@@ -371,7 +576,7 @@ class AndroidComponent(ComponentProtocol):
         Returns:
             bool: True if the component is enabled, False otherwise
         """
-        return self._node.get("enabled", "") == "true"
+        return self._node.get("enabled") == "true"
 
     def screenshot(self, path: Path | None = None) -> Path:
         """
@@ -389,19 +594,29 @@ class AndroidComponent(ComponentProtocol):
         if path is None:
             path = (
                 config.CACHE_DIR
-                / f"{self._tag}-{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}-screenshot.png"
+                / f"{self._tag}-{timestamp()}-screenshot.png"
             )
-        content = portal_http.get_capture(self._window.display_id)
-        with open(path, "wb") as f:
-            f.write(content)
-        img = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        content = self._portal.get_capture(self._window.display_id)
+        window_size = self._adb.get_window_size()
+        if (
+            self._bounds.left == 0
+            and self._bounds.top == 0
+            and self._size.width == window_size.width
+            and self._size.height == window_size.height
+        ):
+            # Full-screen component: the capture already is the crop, so a
+            # PNG decode/encode cycle would be pure waste.
+            path.write_bytes(content)
+            return path
+        img = cv2.imdecode(np.frombuffer(content, np.uint8), cv2.IMREAD_UNCHANGED)
         if img is None:
             raise ValueError("Failed to read screenshot")
         cropped = img[
             self._bounds.top : self._bounds.bottom,
             self._bounds.left : self._bounds.right,
         ]
-        if cropped is None:
-            raise ValueError("Failed to crop screenshot")
-        cv2.imwrite(str(path), cropped)
+        ok, buf = cv2.imencode(".png", cropped, _PNG_WRITE_PARAMS)
+        if not ok:
+            raise ValueError("Failed to encode screenshot")
+        path.write_bytes(buf.tobytes())
         return path
@@ -1,7 +1,7 @@
+import atexit
 import re
-import time
 
-import httpx
+from concurrent.futures import ThreadPoolExecutor
 
 from ..protocol.debug_bridge_protocol import DebugBridgeProtocol
 from ..protocol.device_protocol import DeviceProtocol
@@ -10,8 +10,12 @@ from ..models.device import AndroidDeviceModel
 from ..models.language import Language
 from .android_driver import AndroidDriver
 from .android_adb import AndroidADB
-from .._core import config, hermes_cache, portal_http
-from .._core.portal_protocol import PortalContent
+from .._core import config, hermes_cache
+from .._core.portal_protocol import PortalContent, PortalHTTP
+
+_TOKEN_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
 
 class AndroidDevice(DeviceProtocol):
@@ -29,6 +33,7 @@ class AndroidDevice(DeviceProtocol):
         _adb: AndroidADB - ADB interface for device communication
         _timeout: int - Default timeout for operations
         _port: int - Port for portal service communication
+        _portal: PortalHTTP - HTTP client bound to this device's forwarded port
     """
 
     def __init__(self, device_model: AndroidDeviceModel):
@@ -53,6 +58,13 @@ class AndroidDevice(DeviceProtocol):
         )
         self._timeout = device_model.timeout
         self._port: int = hermes_cache.get_portal_port()
+        # Each device owns its portal client, so multi-device runs never
+        # contend on a shared module-level singleton.
+        self._portal = PortalHTTP(self._port)
+        # Deterministic cleanup happens in disconnect(); atexit is only a
+        # fallback so an abandoned device never leaks its connection pool.
+        # Closing an already-closed client is a no-op.
+        atexit.register(self._portal.close)
 
     @property
     def device_model(self) -> AndroidDeviceModel:
@@ -82,6 +94,22 @@ class AndroidDevice(DeviceProtocol):
         """
         self._timeout = timeout
 
+    def __enter__(self) -> "AndroidDevice":
+        """
+        Connect to the device when entering a ``with`` block.
+
+        Returns:
+            AndroidDevice - This device instance
+        """
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Disconnect from the device when leaving a ``with`` block.
+        """
+        self.disconnect()
+
     def connect(self):
         """
         Connect to the Android device.
@@ -93,12 +121,20 @@ class AndroidDevice(DeviceProtocol):
         """
         if self._driver:
             return
+        if self._portal.is_closed:
+            # disconnect() closes the client, so a reconnect (or a second
+            # `with` block) needs a fresh connection pool. Registering the
+            # new client with atexit is safe: closing the old one again in
+            # the fallback is a no-op.
+            self._portal = PortalHTTP(self._port)
+            atexit.register(self._portal.close)
         self._setup_portal(self._port)
         if not self.ping():
             raise ConnectionError("Portal server not responsive")
         self._driver = AndroidDriver(
             tag=self._device_model.tag,
             adb=self._adb,
+            portal=self._portal,
             token="",
             language=self._language,
             locator_engine=self._device_model.locator_engine,
@@ -123,13 +159,20 @@ class AndroidDevice(DeviceProtocol):
         """
         if self._check_portal_installed():
             return
-        with httpx.Client() as client:
-            tmp_file = config.CACHE_DIR / "app-debug.apk"
-            response = client.get(config.PORTAL_DOWNLOAD_URL)
-            response.raise_for_status()
-            with open(tmp_file, "wb") as f:
-                f.write(response.content)
-            self._adb.install(tmp_file)
+        tmp_file = config.CACHE_DIR / "app-debug.apk"
+        etag_file = config.CACHE_DIR / "app-debug.apk.etag"
+        etag = self._portal.head_etag(config.PORTAL_DOWNLOAD_URL)
+        cached = (
+            etag is not None
+            and tmp_file.exists()
+            and etag_file.exists()
+            and etag_file.read_text() == etag
+        )
+        if not cached:
+            self._portal.download(config.PORTAL_DOWNLOAD_URL, tmp_file)
+            if etag is not None:
+                etag_file.write_text(etag)
+        self._adb.install(tmp_file)
 
     def _setup_portal(self, port: int):
         """
@@ -141,12 +184,28 @@ class AndroidDevice(DeviceProtocol):
         Args:
             port: int - The port to use for portal service communication
         """
-        self._install_portal()
-        self._adb.start_app("com.hermes.portal", ".MainActivity")
-        for _ in range(10):
-            if self._adb.get_pid("com.hermes.portal") != -1:
-                break
-            time.sleep(1)
+        # The APK install path and the adbd port forward have no data
+        # dependency; overlap them so a slow APK download does not serialize
+        # the whole setup. The persistent shell session is lock-protected, so
+        # concurrent adb calls are safe. Everything after this needs the app
+        # installed and stays sequential.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            install = pool.submit(self._install_portal)
+            forward = pool.submit(
+                self._adb.forward_port, port, config.PORTAL_SERVICE_PORT
+            )
+            install.result()
+            forward.result()
+        if not self._adb.start_app_and_wait("com.hermes.portal", ".MainActivity"):
+            # Fallback for builds where `am start -W` is unsupported: one
+            # device-side script that starts the activity and polls for its
+            # process.
+            self._adb.shell(
+                "am start -n com.hermes.portal/.MainActivity; "
+                "for i in 1 2 3 4 5 6 7 8 9 10; do "
+                "pidof com.hermes.portal > /dev/null && break; sleep 1; done",
+                timeout=15000,
+            )
         if not self._adb.check_accessibility_service(
             config.PORTAL_ACCESSIBILITY_SERVICE
         ):
@@ -155,9 +214,7 @@ class AndroidDevice(DeviceProtocol):
                 config.PORTAL_ACCESSIBILITY_SERVICE
             )
             # assert self._adb.insert_content(PortalContent.ENABLE_SOCKET_SERVER)
-        self._adb.forward_port(port, config.PORTAL_SERVICE_PORT)
         self._adb.query_content(PortalContent.ENABLE_SERVICE)
-        portal_http.set_port(port)
 
     def ping(self) -> bool:
         """
@@ -166,7 +223,7 @@ class AndroidDevice(DeviceProtocol):
         Returns:
             bool - True if the portal server is responsive, False otherwise
         """
-        return portal_http.ping()
+        return self._portal.ping()
 
     def _set_token(self) -> str:
         """
@@ -179,8 +236,7 @@ class AndroidDevice(DeviceProtocol):
             ValueError: If no valid token is found
         """
         res = self._adb.query_content(PortalContent.AUTH_TOKEN)
-        pattern = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
-        search_res = re.search(pattern, res)
+        search_res = _TOKEN_RE.search(res)
         if not search_res:
             raise ValueError("token is empty")
         return search_res.group()
@@ -194,6 +250,7 @@ class AndroidDevice(DeviceProtocol):
         if self._port:
             hermes_cache.release_portal_port(self._port)
             self._adb.remove_forward_port(self._port)
+        self._portal.close()
         if self._driver:
             self._driver = None
 
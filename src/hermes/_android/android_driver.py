@@ -1,14 +1,17 @@
 import time
 
-import elementpath
-from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import httpx
+from lxml import etree as ElementTree
 
-from datetime import datetime
 from pathlib import Path
 from typing import Sequence
 from loguru import logger
 
-from .._core import config, portal_http
+from .._core import config
+from .._core.portal_protocol import PortalHTTP
 from ..protocol.component_protocol import ComponentProtocol
 from ..protocol.driver_protocol import DriverProtocol
 from ..protocol.debug_bridge_protocol import DebugBridgeProtocol
@@ -17,11 +20,87 @@ from ..models.device import LocatorEngine
 from ..models.media import ImageModal
 from ..models.language import Language
 from ..models.selector import Selector, SelectorKey, Window, Method
-from .android_component import AndroidComponent
+from .android_component import AndroidComponent, build_engine, evaluate_xpath
 from .._media.image_component import ImageComponent
 from .._media.image_calculate import find_all_templates
 from .selector_to_xpath import SelectorToXpath
 from .selector_to_jsonpath import SelectorToJsonpath
+from ..utils.tools import timestamp
+
+_INDEXED_ATTRS = ("resource-id", "text", "content-desc", "class")
+
+# Parsed hierarchies and their attribute indexes are kept for the last few
+# page states, so flipping back to a recently seen page skips the re-parse;
+# the cap keeps resident memory bounded over long runs.
+_PAGE_CACHE_SIZE = 8
+
+# Fast-key attribute names mapped to the portal search endpoint's parameters.
+_SEARCH_PARAMS = {
+    "resource-id": "resource_id",
+    "text": "text",
+    "content-desc": "description",
+}
+
+_XML_PARSER = ElementTree.XMLParser(
+    remove_blank_text=True, collect_ids=False, huge_tree=True
+)
+
+# Screenshot disk writes happen off the caller's thread so the next portal
+# request is not stalled behind file IO; one worker keeps writes ordered.
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hermes-io")
+
+# Hierarchy fetches issued speculatively while the stability poll is still
+# running; kept separate from _io_executor so screenshot writes never delay
+# a prefetch.
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="hermes-prefetch"
+)
+
+
+def _write_stream(response: httpx.Response, path: Path):
+    """
+    Drain a streaming response to disk in chunks and release its connection.
+
+    Args:
+        response: Streaming response whose body has not been read yet
+        path: Destination file path
+    """
+    try:
+        # buffering=0 writes each chunk straight through instead of copying
+        # it into a BufferedWriter first; the chunks are already large.
+        with open(path, "wb", buffering=0) as f:
+            for chunk in response.iter_bytes(65536):
+                f.write(chunk)
+    finally:
+        response.close()
+
+
+def build_xml_index(
+    root: ElementTree._Element,
+) -> dict[str, dict[str, list[ElementTree._Element]]]:
+    """
+    Build an attribute value index over an XML hierarchy.
+
+    Walks the tree once and groups nodes by the attributes selectors match on,
+    so single-attribute equality lookups become dict reads instead of a full
+    XPath evaluation over the tree.
+
+    Args:
+        root: Root element of the hierarchy
+
+    Returns:
+        dict[str, dict[str, list[ElementTree._Element]]]: Mapping of attribute
+        name to value to the nodes carrying that value
+    """
+    index: dict[str, dict[str, list[ElementTree._Element]]] = {
+        attr: {} for attr in _INDEXED_ATTRS
+    }
+    for node in root.iter():
+        for attr in _INDEXED_ATTRS:
+            value = node.get(attr)
+            if value is not None:
+                index[attr].setdefault(value, []).append(node)
+    return index
 
 
 class AndroidDriver(DriverProtocol):
@@ -33,6 +112,7 @@ class AndroidDriver(DriverProtocol):
 
     Attributes:
         _adb: DebugBridgeProtocol instance for ADB operations
+        _portal: Portal HTTP client bound to this device's forwarded port
         _tag: Device tag for identification
         _language: Language for localization
         _timeout: Default timeout for operations in milliseconds
@@ -49,6 +129,7 @@ class AndroidDriver(DriverProtocol):
     def __init__(
         self,
         adb: DebugBridgeProtocol,
+        portal: PortalHTTP,
         tag: str,
         token: str,
         language: Language,
@@ -60,6 +141,7 @@ class AndroidDriver(DriverProtocol):
 
         Args:
             adb: DebugBridgeProtocol instance for ADB operations
+            portal: Portal HTTP client bound to this device's forwarded port
             tag: Device tag for identification
             token: Authentication token for API calls
             language: Language for localization
@@ -67,10 +149,13 @@ class AndroidDriver(DriverProtocol):
             timeout: Default timeout for operations in milliseconds (default: 8000)
         """
         self._adb = adb
+        self._portal = portal
         self._tag = tag
         self._language = language
         self._timeout = timeout
-        self._window_size: Size | None = None
+        # Window size is constant between orientation changes; fetch it once
+        # here so gesture helpers read a cached value instead of querying adb.
+        self._window_size: Size | None = self._adb.get_window_size()
         self._token = token
         self._locator_engine = (
             SelectorToXpath
@@ -79,9 +164,18 @@ class AndroidDriver(DriverProtocol):
         )
         self._locator_engine_type = locator_engine
         self._headers = {"Authorization": f"Bearer {token}"}
+        if token:
+            # Attach the auth header to the pooled client once; every portal
+            # request then carries it without a per-call headers dict.
+            self._portal.set_headers(self._headers)
         self._latest_page_id = -1
-        self._cached_xml: dict[int, ElementTree.Element] = dict()
+        self._last_stable_check = 0.0
+        self._cached_xml: dict[int, ElementTree._Element] = dict()
         self._cached_json: dict[int, dict] = dict()
+        self._cached_index: dict[
+            int, dict[str, dict[str, list[ElementTree._Element]]]
+        ] = dict()
+        self._batch_actions: list[dict] | None = None
 
     def get_window_size(self, refresh: bool = False) -> Size:
         """
@@ -98,6 +192,15 @@ class AndroidDriver(DriverProtocol):
             self._window_size = _size
         return self._window_size
 
+    def invalidate_window_size(self):
+        """
+        Drop the cached window size.
+
+        Call after an orientation change so the next get_window_size()
+        re-queries the device.
+        """
+        self._window_size = None
+
     def get_xml_tree(self, display_id: int) -> str:
         """
         Get the XML hierarchy of the current screen.
@@ -108,7 +211,7 @@ class AndroidDriver(DriverProtocol):
         Returns:
             str: XML text representation of the screen hierarchy
         """
-        xml_text = portal_http.get_hierarchy(display_id, "xml")
+        xml_text = self._portal.get_hierarchy(display_id, "xml")
         return xml_text
 
     def get_json_tree(self, display_id: int) -> dict:
@@ -121,26 +224,35 @@ class AndroidDriver(DriverProtocol):
         Returns:
             dict: JSON representation of the screen hierarchy
         """
-        json_obj = portal_http.get_hierarchy(display_id, "json")
+        json_obj = self._portal.get_hierarchy(display_id, "json")
         return json_obj
 
     def _wait_stable(self):
         """
         Wait for the screen to stabilize by checking page state ID.
 
+        Polls with exponential backoff instead of a fixed 100 ms cadence, and
+        skips the round-trip entirely when stability was confirmed within the
+        last 50 ms (locator chains often call this back to back).
+
         Returns:
             int: Latest page state ID
         """
-        start = time.time()
-        while time.time() - start < 2:
-            current_page_id = portal_http.get_state_id()
+        start = time.monotonic()
+        if start - self._last_stable_check < 0.05:
+            return self._latest_page_id
+        delay = 0.05
+        while time.monotonic() - start < 2:
+            current_page_id = self._portal.get_state_id()
             if current_page_id == self._latest_page_id:
                 break
             self._latest_page_id = current_page_id
-            time.sleep(0.1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.8)
+        self._last_stable_check = time.monotonic()
         return self._latest_page_id
 
-    def get_xml_element_tree(self, display_id: int) -> ElementTree.Element:
+    def get_xml_element_tree(self, display_id: int) -> ElementTree._Element:
         """
         Get the XML element tree of the current screen.
 
@@ -148,20 +260,72 @@ class AndroidDriver(DriverProtocol):
             display_id: Display ID to get the element tree for
 
         Returns:
-            ElementTree.Element: XML element tree of the screen
+            ElementTree._Element: XML element tree of the screen
         """
+        # Speculatively fetch the hierarchy while the stability poll runs: on
+        # a page that is already stable (the common case) the download has
+        # overlapped the stateId round-trips by the time the poll returns. If
+        # the state moved under us, the guess is discarded and refetched.
+        guessed_id = self._latest_page_id
+        speculative = None
+        if guessed_id not in self._cached_xml:
+            speculative = _prefetch_executor.submit(
+                self._portal.get_hierarchy_xml_bytes, display_id
+            )
         self._wait_stable()
-        if n := self._cached_xml.get(self._latest_page_id):
+        # Compare against None explicitly: truth-testing an lxml element
+        # means "has children" (with a FutureWarning), not "cache hit".
+        if (n := self._cached_xml.get(self._latest_page_id)) is not None:
+            # Re-insert so eviction drops the least recently used page
+            # rather than the oldest parsed one.
+            self._cached_xml[self._latest_page_id] = self._cached_xml.pop(
+                self._latest_page_id
+            )
             return n
         else:
-            xml_text = portal_http.get_hierarchy(display_id, "xml")
-            xml_tree = ElementTree.XML(xml_text)
-            self._cached_xml = {self._latest_page_id: xml_tree}
+            if speculative is not None and self._latest_page_id == guessed_id:
+                xml_bytes = speculative.result()
+            else:
+                xml_bytes = self._portal.get_hierarchy_xml_bytes(display_id)
+            xml_tree = ElementTree.fromstring(xml_bytes, _XML_PARSER)
+            self._cached_xml[self._latest_page_id] = xml_tree
+            while len(self._cached_xml) > _PAGE_CACHE_SIZE:
+                self._cached_xml.pop(next(iter(self._cached_xml)))
             return xml_tree
 
+    def _get_xml_index(
+        self, display_id: int
+    ) -> dict[str, dict[str, list[ElementTree._Element]]]:
+        """
+        Get the attribute index for the current page, building it lazily.
+
+        Args:
+            display_id: Display ID to index the hierarchy for
+
+        Returns:
+            dict[str, dict[str, list[ElementTree._Element]]]: Attribute index
+            keyed by attribute name and value
+        """
+        page = self.get_xml_element_tree(display_id)
+        if (index := self._cached_index.get(self._latest_page_id)) is not None:
+            self._cached_index[self._latest_page_id] = self._cached_index.pop(
+                self._latest_page_id
+            )
+            return index
+        index = build_xml_index(page)
+        self._cached_index[self._latest_page_id] = index
+        while len(self._cached_index) > _PAGE_CACHE_SIZE:
+            self._cached_index.pop(next(iter(self._cached_index)))
+        return index
+
     def _find_nodes_by_xpath(
-        self, xpath: str, visible: bool, window: Window, timeout: int
-    ) -> Sequence[ElementTree.Element]:
+        self,
+        xpath: str,
+        visible: bool,
+        window: Window,
+        timeout: int,
+        fast_key: tuple[str, str] | None = None,
+    ) -> Sequence[ElementTree._Element]:
         """
         Find nodes matching the given XPath expression.
 
@@ -170,24 +334,43 @@ class AndroidDriver(DriverProtocol):
             visible: Whether to only return visible elements
             window: Window to search in
             timeout: Timeout in milliseconds
+            fast_key: Optional (attribute, value) pair for index-based lookup
 
         Returns:
-            Sequence[ElementTree.Element]: List of matching elements
+            Sequence[ElementTree._Element]: List of matching elements
 
         Raises:
             TimeoutError: If no elements found within timeout
         """
         logger.debug(f"Find nodes by xpath: {xpath}")
-        start_time = time.time()
-        while time.time() - start_time < int(timeout / 1000):
-            page = self.get_xml_element_tree(window.display_id)
-            elements = elementpath.select(page, xpath)
+        # int(timeout / 1000) floored sub-second budgets to zero, so e.g.
+        # timeout=500 never polled at all; keep the deadline in float seconds
+        # on the monotonic clock instead.
+        deadline = time.monotonic() + timeout / 1000
+        last_page_id = None
+        while time.monotonic() < deadline:
+            self._wait_stable()
+            if self._latest_page_id == last_page_id:
+                # Same page state as the previous iteration: the parsed tree
+                # cannot have changed, so re-evaluating the expression would
+                # only repeat the previous answer.
+                time.sleep(0.05)
+                continue
+            last_page_id = self._latest_page_id
+            if fast_key is not None:
+                attr, value = fast_key
+                index = self._get_xml_index(window.display_id)
+                elements = index.get(attr, {}).get(value, [])
+            else:
+                page = self.get_xml_element_tree(window.display_id)
+                elements = evaluate_xpath(page, xpath)
             if elements:
                 if visible:
                     return elements
             else:
                 if not visible:
                     return []
+            time.sleep(0.05)
         raise TimeoutError(f"Find nodes by xpath timeout: {xpath}")
 
     def _match_image(
@@ -216,7 +399,7 @@ class AndroidDriver(DriverProtocol):
         index = 0
         start_time = time.time()
         while time.time() - start_time < int(timeout / 1000):
-            resource = self.screenshot()
+            resource = self._screenshot_sync()
             results = find_all_templates(resource, image, threshold)
             if results:
                 if visible:
@@ -252,6 +435,49 @@ class AndroidDriver(DriverProtocol):
                     return tragets
         raise TimeoutError("Match image timeout")
 
+    def _resolve_point(
+        self, target: ComponentProtocol | Selector | Point
+    ) -> Point | None:
+        """
+        Resolve a gesture target to its center point.
+
+        Args:
+            target: Target element, supports ComponentProtocol, Selector, or Point
+
+        Returns:
+            Point | None: Center point of the target, or None if not found
+        """
+        if isinstance(target, Point):
+            return target
+        if isinstance(target, Selector):
+            element = self.locator(target)
+            return element.get_center() if element else None
+        # Any other component (ImageComponent included) is resolved through
+        # its protocol method; ComponentProtocol is not runtime_checkable, so
+        # this stays duck-typed rather than an isinstance check.
+        return target.get_center()
+
+    @contextmanager
+    def with_batch(self, display_id: int = 0):
+        """
+        Collect tap/long_press gestures and flush them in one portal call.
+
+        Inside the context, tap() and long_press() queue their gestures
+        instead of issuing one HTTP round-trip each; on exit the queue is
+        posted to the portal batch endpoint and executed server-side in
+        order. Individual gestures outside the context stay synchronous.
+
+        Args:
+            display_id: Display ID the batched gestures run on (default: 0)
+        """
+        self._batch_actions = []
+        try:
+            yield self
+        finally:
+            actions, self._batch_actions = self._batch_actions, None
+            if actions:
+                self._portal.action_batch(display_id, actions)
+
     def tap(
         self, target: ComponentProtocol | Selector | Point, wait_render: int = 1000
     ):
@@ -265,17 +491,25 @@ class AndroidDriver(DriverProtocol):
         Raises:
             ValueError: If target type is invalid
         """
+        if self._batch_actions is not None:
+            point = self._resolve_point(target)
+            if point:
+                self._batch_actions.append(
+                    {"type": "tap", "x": point.x, "y": point.y, "duration": 100}
+                )
+            return
         if isinstance(target, AndroidComponent):
-            target.tap()
+            target.tap(wait_render=0)
         elif isinstance(target, Selector):
             element = self.locator(target)
             if element:
-                element.tap()
+                element.tap(wait_render=0)
         elif isinstance(target, Point):
-            portal_http.action_tap(0, target)
+            self._portal.action_tap(0, target)
         else:
             raise ValueError("Invalid target type")
-        time.sleep(wait_render / 1000)
+        if wait_render > 0:
+            time.sleep(wait_render / 1000)
 
     def long_press(
         self,
@@ -294,17 +528,30 @@ class AndroidDriver(DriverProtocol):
         Raises:
             ValueError: If target type is invalid
         """
+        if self._batch_actions is not None:
+            point = self._resolve_point(target)
+            if point:
+                self._batch_actions.append(
+                    {
+                        "type": "longPress",
+                        "x": point.x,
+                        "y": point.y,
+                        "duration": duration,
+                    }
+                )
+            return
         if isinstance(target, AndroidComponent):
-            target.long_press(duration)
+            target.long_press(duration, wait_render=0)
         elif isinstance(target, Selector):
             element = self.locator(target)
             if element:
-                element.long_press(duration)
+                element.long_press(duration, wait_render=0)
         elif isinstance(target, Point):
-            portal_http.action_long_press(0, target, duration)
+            self._portal.action_long_press(0, target, duration)
         else:
             raise ValueError("Invalid target type")
-        time.sleep(wait_render / 1000)
+        if wait_render > 0:
+            time.sleep(wait_render / 1000)
 
     def locator(
         self,
@@ -333,26 +580,30 @@ class AndroidDriver(DriverProtocol):
         """
         if language is None:
             language = self._language
-        _engine = self._locator_engine(selector, language, combination)
+        _engine = build_engine(self._locator_engine, selector, language, combination)
         if _engine.get_method() == Method.XPATH:
+            syntax = _engine.get_syntax()
+            window = _engine.get_window()
             nodes = self._find_nodes_by_xpath(
-                _engine.get_syntax(),
+                syntax,
                 visible=visible,
-                window=_engine.get_window(),
+                window=window,
                 timeout=timeout or self._timeout,
+                fast_key=_engine.get_fast_key(),
             )
             if not nodes:
                 return None
             return AndroidComponent(
-                parent_syntax=_engine.get_syntax(),
+                parent_syntax=syntax,
                 locator_engine=self._locator_engine_type,
                 token=self._token,
                 tag=self._tag,
                 adb=self._adb,
+                portal=self._portal,
                 node=nodes[0],
                 language=language,
                 timeout=self._timeout,
-                window=_engine.get_window(),
+                window=window,
             )
         elif _engine.get_method() == Method.IMAGE:
             targets = self._match_image(
@@ -396,35 +647,76 @@ class AndroidDriver(DriverProtocol):
         Returns:
             Sequence[ComponentProtocol]: List of located components
 
+        Raises:
+            NotImplementedError: If locator engine is not implemented
+        """
+        return list(
+            self.locators_iter(
+                selector,
+                visible=visible,
+                combination=combination,
+                language=language,
+                timeout=timeout,
+            )
+        )
+
+    def locators_iter(
+        self,
+        selector: Selector,
+        *,
+        visible: bool = True,
+        combination: Sequence[SelectorKey] | None = None,
+        language: Language | None = None,
+        timeout: int | None = None,
+    ):
+        """
+        Lazily yield components matching the given selector.
+
+        Component wrappers are constructed one at a time, so a caller that
+        only consumes the first few matches never pays for the rest of a
+        large hit list.
+
+        Args:
+            selector: Selector to use for locating components
+            visible: Whether to only return visible elements (default: True)
+            combination: Sequence of SelectorKey for combination (default: None)
+            language: Language for localization (default: self._language)
+            timeout: Timeout in milliseconds (default: self._timeout)
+
+        Yields:
+            ComponentProtocol: Located components in document order
+
         Raises:
             NotImplementedError: If locator engine is not implemented
         """
         if language is None:
             language = self._language
-        _engine = self._locator_engine(selector, language, combination)
+        _engine = build_engine(self._locator_engine, selector, language, combination)
         if _engine.get_method() == Method.XPATH:
+            syntax = _engine.get_syntax()
+            window = _engine.get_window()
             nodes = self._find_nodes_by_xpath(
-                _engine.get_syntax(),
+                syntax,
                 visible=visible,
-                window=_engine.get_window(),
+                window=window,
                 timeout=timeout or self._timeout,
+                fast_key=_engine.get_fast_key(),
             )
-            if not nodes:
-                return []
-            return [
-                AndroidComponent(
-                    parent_syntax=_engine.get_syntax(),
-                    locator_engine=self._locator_engine_type,
-                    token=self._token,
-                    tag=self._tag,
-                    adb=self._adb,
-                    node=node,
-                    language=language,
-                    timeout=self._timeout,
-                    window=_engine.get_window(),
-                )
-                for node in nodes
-            ]
+            # All kwargs except the node are identical across the hit list;
+            # build them once instead of per matched component.
+            shared = dict(
+                parent_syntax=syntax,
+                locator_engine=self._locator_engine_type,
+                token=self._token,
+                tag=self._tag,
+                adb=self._adb,
+                portal=self._portal,
+                language=language,
+                timeout=self._timeout,
+                window=window,
+            )
+            for node in nodes:
+                yield AndroidComponent(node=node, **shared)
         elif _engine.get_method() == Method.IMAGE:
             targets = self._match_image(
                 _engine.get_image(),
@@ -432,22 +724,53 @@ class AndroidDriver(DriverProtocol):
                 visible=visible,
                 timeout=timeout or self._timeout,
             )
-            if not targets:
-                return []
-            return [
-                ImageComponent(
+            for target in targets:
+                yield ImageComponent(
                     image=target,
                     language=language,
                     timeout=self._timeout,
                     window=_engine.get_window(),
                 )
-                for target in targets
-            ]
         else:
             raise NotImplementedError(
                 f"Locator engine {self._locator_engine_type} not implemented"
             )
 
+    def _try_locator(
+        self,
+        selector: Selector,
+        *,
+        combination: Sequence[SelectorKey] | None = None,
+        language: Language | None = None,
+        timeout: int | None = None,
+    ) -> ComponentProtocol | None:
+        """
+        Locate a visible component, returning None instead of raising on timeout.
+
+        scroll_into_view probes for its target between swipes; a miss there is
+        the expected outcome that drives the next attempt, not an error, so
+        the TimeoutError from _find_nodes_by_xpath is swallowed here.
+
+        Args:
+            selector: Selector to use for locating the component
+            combination: Sequence of SelectorKey for combination (default: None)
+            language: Language for localization (default: self._language)
+            timeout: Timeout in milliseconds (default: self._timeout)
+
+        Returns:
+            ComponentProtocol | None: Located component or None if not found
+        """
+        try:
+            return self.locator(
+                selector,
+                visible=True,
+                combination=combination,
+                language=language,
+                timeout=timeout,
+            )
+        except TimeoutError:
+            return None
+
     def scroll_into_view(
         self,
         target: Selector,
@@ -480,123 +803,65 @@ class AndroidDriver(DriverProtocol):
             target_language = self._language
         if scrollable_language is None:
             scrollable_language = self._language
-        if isinstance(scrollable, Bounds):
-            if horizontal:
-                start = Point(
-                    x=int(scrollable.left + (scrollable.right - scrollable.left) / 2),
-                    y=int(scrollable.top + (scrollable.bottom - scrollable.top) / 2),
+        _target_engine = build_engine(
+            self._locator_engine, target, target_language, target_combination
+        )
+        if fast_key := _target_engine.get_fast_key():
+            # Single-attribute targets can be searched on-device by the
+            # portal: one request replaces the swipe-and-relocate loop.
+            attr, value = fast_key
+            try:
+                self._portal.action_search(
+                    display_id,
+                    direction="right" if horizontal else "down",
+                    **{_SEARCH_PARAMS[attr]: value},
                 )
-                end = Point(
-                    x=int(scrollable.left + (scrollable.right - scrollable.left) / 2),
-                    y=int(
-                        scrollable.bottom * 0.7
-                        + (scrollable.bottom - scrollable.top) / 2
-                    ),
+            except httpx.HTTPError:
+                logger.warning(
+                    "On-device scroll search failed, falling back to swipe loop"
                 )
             else:
-                start = Point(
-                    x=int(scrollable.left + (scrollable.right - scrollable.left) / 2),
-                    y=int(scrollable.top + (scrollable.bottom - scrollable.top) / 2),
-                )
-                end = Point(
-                    x=int(scrollable.left + (scrollable.right - scrollable.left) / 2),
-                    y=int(
-                        scrollable.top * 0.3 + (scrollable.bottom - scrollable.top) / 2
-                    ),
+                return self._try_locator(
+                    target,
+                    combination=target_combination,
+                    language=target_language,
+                    timeout=1000,
                 )
+        if isinstance(scrollable, Bounds):
+            bounds = scrollable
         else:
-            scrollable_element = self.locator(
+            scrollable_element = self._try_locator(
                 scrollable,
-                visible=True,
                 combination=scrollable_combination,
                 language=scrollable_language,
                 timeout=1000,
             )
             if not scrollable_element:
                 return None
-            if horizontal:
-                start = Point(
-                    x=int(
-                        scrollable_element.get_bounds().left
-                        + (
-                            scrollable_element.get_bounds().right
-                            - scrollable_element.get_bounds().left
-                        )
-                        / 2
-                    ),
-                    y=int(
-                        scrollable_element.get_bounds().top
-                        + (
-                            scrollable_element.get_bounds().bottom
-                            - scrollable_element.get_bounds().top
-                        )
-                        / 2
-                    ),
-                )
-                end = Point(
-                    x=int(
-                        scrollable_element.get_bounds().left
-                        + (
-                            scrollable_element.get_bounds().right
-                            - scrollable_element.get_bounds().left
-                        )
-                        / 2
-                    ),
-                    y=int(
-                        scrollable_element.get_bounds().bottom * 0.7
-                        + (
-                            scrollable_element.get_bounds().bottom
-                            - scrollable_element.get_bounds().top
-                        )
-                        / 2
-                    ),
-                )
-            else:
-                start = Point(
-                    x=int(
-                        scrollable_element.get_bounds().left
-                        + (
-                            scrollable_element.get_bounds().right
-                            - scrollable_element.get_bounds().left
-                        )
-                        / 2
-                    ),
-                    y=int(
-                        scrollable_element.get_bounds().top
-                        + (
-                            scrollable_element.get_bounds().bottom
-                            - scrollable_element.get_bounds().top
-                        )
-                        / 2
-                    ),
-                )
-                end = Point(
-                    x=int(
-                        scrollable_element.get_bounds().left
-                        + (
-                            scrollable_element.get_bounds().right
-                            - scrollable_element.get_bounds().left
-                        )
-                        / 2
-                    ),
-                    y=int(
-                        scrollable_element.get_bounds().top * 0.3
-                        + (
-                            scrollable_element.get_bounds().bottom
-                            - scrollable_element.get_bounds().top
-                        )
-                        / 2
-                    ),
-                )
+            bounds = scrollable_element.get_bounds()
+        # Swipe geometry is invariant across the retry loop; derive it once
+        # from the scrollable bounds instead of per attempt. model_construct
+        # skips pydantic validation, safe here as the fields are already ints.
+        mid_x = int(bounds.left + (bounds.right - bounds.left) / 2)
+        half_height = (bounds.bottom - bounds.top) / 2
+        start = Point.model_construct(x=mid_x, y=int(bounds.top + half_height))
+        if horizontal:
+            end = Point.model_construct(
+                x=mid_x, y=int(bounds.bottom * 0.7 + half_height)
+            )
+        else:
+            end = Point.model_construct(x=mid_x, y=int(bounds.top * 0.3 + half_height))
         for _ in range(8):
-            portal_http.action_swipe(0, start, end)
-            return self.locator(
+            self._portal.action_swipe(0, start, end)
+            found = self._try_locator(
                 target,
-                visible=True,
                 combination=target_combination,
                 language=target_language,
-                timeout=1000,
+                timeout=500,
             )
+            if found:
+                return found
+        return None
 
     def drag_and_drop(
         self,
@@ -615,25 +880,10 @@ class AndroidDriver(DriverProtocol):
             display_id: Display ID (default: 0)
             duration: Drag duration in milliseconds (default: 2000)
         """
-        if isinstance(start, Point):
-            _start = start
-        elif isinstance(start, Selector):
-            _start = self.locator(start, visible=True)
-            if not _start:
-                return None
-            _start = _start.get_center()
-        else:
-            _start = start.get_center()
-
-        if isinstance(end, Point):
-            _end = end
-        elif isinstance(end, Selector):
-            _end = self.locator(end, visible=True)
-            if not _end:
-                return None
-            _end = _end.get_center()
-        else:
-            _end = end.get_center()
+        _start = self._resolve_point(start)
+        _end = self._resolve_point(end)
+        if _start is None or _end is None:
+            return None
         self._adb.drag_and_drop(_start, _end, duration=duration)
 
     def swipe(
@@ -657,27 +907,12 @@ class AndroidDriver(DriverProtocol):
             repeat: Number of times to repeat the swipe (default: 1)
             wait_render: Wait time after swipe in milliseconds (default: 1000)
         """
-        if isinstance(start, Point):
-            _start = start
-        elif isinstance(start, Selector):
-            _start = self.locator(start, visible=True)
-            if not _start:
-                return None
-            _start = _start.get_center()
-        else:
-            _start = start.get_center()
-
-        if isinstance(end, Point):
-            _end = end
-        elif isinstance(end, Selector):
-            _end = self.locator(end, visible=True)
-            if not _end:
-                return None
-            _end = _end.get_center()
-        else:
-            _end = end.get_center()
+        _start = self._resolve_point(start)
+        _end = self._resolve_point(end)
+        if _start is None or _end is None:
+            return None
         for _ in range(repeat):
-            portal_http.action_swipe(0, _start, _end, duration=duration)
+            self._portal.action_swipe(0, _start, _end, duration=duration)
             time.sleep(wait_render / 1000)
 
     def zoom_in(
@@ -699,20 +934,14 @@ class AndroidDriver(DriverProtocol):
             duration: Zoom duration in milliseconds (default: 500)
             wait_render: Wait time after zoom in milliseconds (default: 500)
         """
-        if isinstance(target, Point):
-            _target = target
-        elif isinstance(target, Selector):
-            _target = self.locator(target, visible=True)
-            if not _target:
-                return None
-            _target = _target.get_center()
-        else:
-            _target = target.get_center()
+        _target = self._resolve_point(target)
+        if _target is None:
+            return None
         w_size = self.get_window_size()
-        m_size = Point(
+        m_size = Point.model_construct(
             x=int(w_size.width / 2 * scale), y=int(w_size.height / 2 * scale)
         )
-        portal_http.action_custom_zoom(
+        self._portal.action_custom_zoom(
             display_id=display_id,
             start1=_target,
             end1=m_size,
@@ -741,20 +970,14 @@ class AndroidDriver(DriverProtocol):
             duration: Zoom duration in milliseconds (default: 200)
             wait_render: Wait time after zoom in milliseconds (default: 500)
         """
-        if isinstance(target, Point):
-            _target = target
-        elif isinstance(target, Selector):
-            _target = self.locator(target, visible=True)
-            if not _target:
-                return None
-            _target = _target.get_center()
-        else:
-            _target = target.get_center()
+        _target = self._resolve_point(target)
+        if _target is None:
+            return None
         w_size = self.get_window_size()
-        m_size = Point(
+        m_size = Point.model_construct(
             x=int(w_size.width / 2 * scale), y=int(w_size.height / 2 * scale)
         )
-        portal_http.action_custom_zoom(
+        self._portal.action_custom_zoom(
             display_id=display_id,
             start1=m_size,
             end1=_target,
@@ -771,7 +994,7 @@ class AndroidDriver(DriverProtocol):
         Args:
             display_id: Display ID
         """
-        portal_http.action_clear_text(display_id)
+        self._portal.action_clear_text(display_id)
 
     def input_text(self, display_id: int, content: str):
         """
@@ -781,12 +1004,40 @@ class AndroidDriver(DriverProtocol):
             display_id: Display ID
             content: Text to input
         """
-        portal_http.action_input_text(display_id, content)
+        self._portal.action_input_text(display_id, content)
 
     def screenshot(self, path: Path | None = None, display_id: int = 0) -> Path:
         """
         Capture a screenshot of the screen.
 
+        Args:
+            path: Path to save the screenshot (default: auto-generated path)
+            display_id: Display ID (default: 0)
+
+        Returns:
+            Path: Path to the saved screenshot. The write is queued on a
+            background worker, so the file may lag the return by a moment.
+        """
+        if path is None:
+            path = (
+                config.CACHE_DIR
+                / f"{self._tag}-{timestamp()}-screenshot.png"
+            )
+        # The request goes out now, so the capture reflects the screen at
+        # call time; the body is drained to disk in chunks off-thread, so
+        # peak memory stays at one chunk instead of the whole PNG.
+        response = self._portal.stream_capture(display_id)
+        _io_executor.submit(_write_stream, response, path)
+        return path
+
+    def _screenshot_sync(self, path: Path | None = None, display_id: int = 0) -> Path:
+        """
+        Capture a screenshot and return only once it is fully on disk.
+
+        Internal consumers such as image matching read the file back
+        immediately after the call, so they cannot use the deferred write
+        screenshot() queues on the IO worker.
+
         Args:
             path: Path to save the screenshot (default: auto-generated path)
             display_id: Display ID (default: 0)
@@ -797,9 +1048,7 @@ class AndroidDriver(DriverProtocol):
         if path is None:
             path = (
                 config.CACHE_DIR
-                / f"{self._tag}-{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}-screenshot.png"
+                / f"{self._tag}-{timestamp()}-screenshot.png"
             )
-        content = portal_http.get_capture(display_id)
-        with open(path, "wb") as f:
-            f.write(content)
+        _write_stream(self._portal.stream_capture(display_id), path)
         return path
@@ -112,6 +112,15 @@ class SelectorToJsonpath(SelectorToPathProtocol):
         """
         return self._threshold
 
+    def get_fast_key(self):
+        """
+        Get the attribute equality pair for index-based lookup.
+
+        Returns:
+            None: JSONPath lookup has no attribute index fast path
+        """
+        return None
+
     def _validate_combination(self):
         """
         Validate and process the selector combination.
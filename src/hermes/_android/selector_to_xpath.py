@@ -23,6 +23,28 @@ KEYS = [
     SelectorKey.IMAGE,
 ]
 
+_FAST_KEY_ATTRS = {
+    SelectorKey.ID: "resource-id",
+    SelectorKey.TEXT: "text",
+    SelectorKey.DESCRIPTION: "content-desc",
+}
+
+# Predicate templates for attribute-based keys; XPATH, IMAGE and CLASS_NAME
+# are structural and handled explicitly in _process_selector.
+_PREDICATE_TEMPLATES = {
+    SelectorKey.ID: '@resource-id="{}"',
+    SelectorKey.TEXT: '@text="{}"',
+    SelectorKey.DESCRIPTION: '@content-desc="{}"',
+    SelectorKey.TEXT_STARTS_WITH: 'starts-with(@text, "{}")',
+    SelectorKey.TEXT_ENDS_WITH: 'ends-with(@text, "{}")',
+    SelectorKey.TEXT_CONTAINS: 'contains(@text, "{}")',
+    SelectorKey.TEXT_MATCHES: 'matches(@text, "{}")',
+    SelectorKey.DESCRIPTION_STARTS_WITH: 'starts-with(@content-desc, "{}")',
+    SelectorKey.DESCRIPTION_ENDS_WITH: 'ends-with(@content-desc, "{}")',
+    SelectorKey.DESCRIPTION_CONTAINS: 'contains(@content-desc, "{}")',
+    SelectorKey.DESCRIPTION_MATCHES: 'matches(@content-desc, "{}")',
+}
+
 
 class SelectorToXpath(SelectorToPathProtocol):
     """
@@ -55,6 +77,7 @@ class SelectorToXpath(SelectorToPathProtocol):
         self._xpath: str | None = None
         self._image: Path | None = None
         self._threshold: float = 0.95
+        self._fast_key: tuple[str, str] | None = None
         self._inused_selector = self._valiadate_combination()
         self._process_selector()
 
@@ -113,6 +136,16 @@ class SelectorToXpath(SelectorToPathProtocol):
         """
         return self._threshold
 
+    def get_fast_key(self):
+        """
+        Get the attribute equality pair for index-based lookup.
+
+        Returns:
+            tuple[str, str] | None: (attribute, value) when the selector is a
+            single exact attribute match, None for anything more complex
+        """
+        return self._fast_key
+
     def _valiadate_combination(self):
         """
         Validate and process the selector combination.
@@ -151,44 +184,28 @@ class SelectorToXpath(SelectorToPathProtocol):
         """
         _values = []
         _xpath = "//*"
+        if len(self._inused_selector) == 1:
+            key, value = next(iter(self._inused_selector.items()))
+            if key in _FAST_KEY_ATTRS and isinstance(value, str):
+                self._fast_key = (_FAST_KEY_ATTRS[key], value)
         # Handle CLASS_NAME separately
         if SelectorKey.CLASS_NAME in self._inused_selector:
             _xpath = f"//{self._inused_selector[SelectorKey.CLASS_NAME]}"
             self._inused_selector.pop(SelectorKey.CLASS_NAME)
         for key, value in self._inused_selector.items():
-            if key == SelectorKey.ID:
-                _values.append(f'@resource-id="{value}"')
-            elif key == SelectorKey.TEXT:
-                _values.append(f'@text="{value}"')
-            elif key == SelectorKey.DESCRIPTION:
-                _values.append(f'@content-desc="{value}"')
-            elif key == SelectorKey.XPATH:
+            if key == SelectorKey.XPATH:
                 self._xpath = value
                 self._method = Method.XPATH
                 return
-            elif key == SelectorKey.TEXT_STARTS_WITH:
-                _values.append(f'starts-with(@text, "{value}")')
-            elif key == SelectorKey.TEXT_ENDS_WITH:
-                _values.append(f'ends-with(@text, "{value}")')
-            elif key == SelectorKey.TEXT_CONTAINS:
-                _values.append(f'contains(@text, "{value}")')
-            elif key == SelectorKey.TEXT_MATCHES:
-                _values.append(f'matches(@text, "{value}")')
-            elif key == SelectorKey.DESCRIPTION_STARTS_WITH:
-                _values.append(f'starts-with(@content-desc, "{value}")')
-            elif key == SelectorKey.DESCRIPTION_ENDS_WITH:
-                _values.append(f'ends-with(@content-desc, "{value}")')
-            elif key == SelectorKey.DESCRIPTION_CONTAINS:
-                _values.append(f'contains(@content-desc, "{value}")')
-            elif key == SelectorKey.DESCRIPTION_MATCHES:
-                _values.append(f'matches(@content-desc, "{value}")')
-            elif key == SelectorKey.IMAGE:
+            if key == SelectorKey.IMAGE:
                 self._method = Method.IMAGE
                 self._image = value.path
                 self._threshold = value.threshold
                 return
-            else:
+            template = _PREDICATE_TEMPLATES.get(key)
+            if template is None:
                 raise ValueError(f"Invalid selector key: {key}")
+            _values.append(template.format(value))
         if _values:
             self._method = Method.XPATH
             self._xpath = _xpath + "[" + " and ".join(_values) + "]"
@@ -4,4 +4,3 @@ from .portal_protocol import PortalHTTP
 
 config = Config()
 hermes_cache = HermesCache()
-portal_http = PortalHTTP()
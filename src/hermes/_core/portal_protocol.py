@@ -1,12 +1,29 @@
 import time
 import httpx
+import orjson
 
+from functools import lru_cache
+from pathlib import Path
 from typing import overload, Literal
 from loguru import logger
 
 from ..models.component import Point
 
 
+@lru_cache(maxsize=64)
+def _format_url(template: str, display_id: int) -> str:
+    """
+    按(端点模板, display_id)缓存格式化后的请求路径
+
+    轮询热路径上每次请求都要做的str.format只需做一次
+
+    :param template: 端点路径模板
+    :param display_id: 显示ID
+    :return: 格式化后的请求路径
+    """
+    return template.format(display_id)
+
+
 class PortalContent:
     AUTH_TOKEN = "content://com.hermes.portal.provider/auth-token"
     ENABLE_SERVICE = "content://com.hermes.portal.provider/start-service"
@@ -23,6 +40,7 @@ class PortalHTTP:
     TAP = ACTION + "/tap"
     LONG_PRESS = ACTION + "/longPress"
     SWIPE = ACTION + "/swipe"
+    BATCH = ACTION + "/batch"
     ZOOM = ACTION + "/zoom"
     CUSTOM_ZOOM = ACTION + "/customZoom"
     INPUT = DISPLAYS + "/input"
@@ -32,9 +50,33 @@ class PortalHTTP:
     NOTIFICATIONS = "/notification"
     TRIGGER_NOTIFICATION = NOTIFICATIONS + "/trigger"
 
-    def __init__(self):
-        self.base_url = "http://127.0.0.1:8200/v1"
-        self._client = httpx.Client(timeout=3, base_url=self.base_url)
+    def __init__(self, port: int = 8200):
+        """
+        :param port: Portal服务器端口号
+        """
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+        self._client = self._build_client(self.base_url)
+
+    @staticmethod
+    def _build_client(base_url: str) -> httpx.Client:
+        """
+        构建带连接池和重试的httpx客户端
+
+        连接保持keep-alive复用，避免每次操作重新建立TCP连接
+
+        :param base_url: Portal服务器基础URL
+        :return: 配置好的httpx.Client实例
+        """
+        return httpx.Client(
+            base_url=base_url,
+            timeout=httpx.Timeout(3, connect=2.0, read=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=32,
+                keepalive_expiry=60,
+            ),
+            transport=httpx.HTTPTransport(retries=1),
+        )
 
     def set_port(self, port: int):
         """
@@ -44,28 +86,106 @@ class PortalHTTP:
         """
         self.base_url = f"http://127.0.0.1:{port}/v1"
         self._client.close()
-        self._client = httpx.Client(timeout=3, base_url=self.base_url)
+        self._client = self._build_client(self.base_url)
+
+    def set_headers(self, headers: dict[str, str]):
+        """
+        把持久请求头挂到客户端上
+
+        认证头只需设置一次，之后所有请求自动携带，
+        避免每次调用重建headers字典
+
+        :param headers: 要附加的请求头
+        """
+        self._client.headers.update(headers)
+
+    def close(self):
+        """
+        关闭底层httpx客户端并释放连接池
+        """
+        self._client.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        底层httpx客户端是否已关闭
+
+        :return: 客户端已关闭则返回True
+        """
+        return self._client.is_closed
+
+    def _post_json(self, url: str, payload: dict) -> httpx.Response:
+        """
+        以orjson序列化的JSON请求体发送POST请求
+
+        orjson比httpx内置的json.dumps快数倍且直接产出bytes，
+        手势类接口每次调用都会走这条路径
+
+        :param url: 请求路径
+        :param payload: 请求体字典
+        :return: httpx.Response响应对象
+        """
+        return self._client.post(
+            url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+
+    def head_etag(self, url: str) -> str | None:
+        """
+        获取下载地址的ETag，用于判断本地缓存是否仍然有效
+
+        :param url: 绝对下载地址
+        :return: ETag字符串，请求失败或服务端未提供时返回None
+        """
+        try:
+            response = self._client.head(url, timeout=httpx.Timeout(10, connect=5.0))
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        return response.headers.get("etag")
+
+    def download(self, url: str, dest: Path):
+        """
+        流式下载文件到本地，复用客户端连接池
+
+        按1 MiB分块写盘，避免把整个响应体读进内存
+
+        :param url: 绝对下载地址
+        :param dest: 本地保存路径
+        """
+        with self._client.stream(
+            "GET", url, timeout=httpx.Timeout(60, connect=5.0)
+        ) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                for chunk in response.iter_bytes(1024 * 1024):
+                    f.write(chunk)
 
     def _check_response(self, response: httpx.Response):
         response.raise_for_status()
-        return response.json()
+        # orjson直接解析bytes，省去httpx内部先解码为str的一次拷贝
+        return orjson.loads(response.content)
 
     def ping(self) -> bool:
         """
         检查Portal服务器是否响应
 
+        采用指数退避重试：服务正常时首次尝试约50ms内返回，
+        服务不可用时总等待约6秒后放弃，而不是固定每秒轮询
+
         :return: 如果服务器响应则返回True，否则返回False
         """
-        for i in range(5):
+        for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2):
             try:
-                response = self._client.get(self.PING)
+                response = self._client.get(self.PING, timeout=delay * 2)
             except Exception as e:
-                logger.warning(f"Ping portal server failed: {e}, retry {i}")
-                time.sleep(1)
+                logger.warning(f"Ping portal server failed: {e}, retry in {delay}s")
+                time.sleep(delay)
                 continue
             if response.status_code == 200:
                 return True
-            time.sleep(1)
+            time.sleep(delay)
         return False
 
     def get_state_id(self) -> int:
@@ -89,7 +209,7 @@ class PortalHTTP:
             "hasChanged": True,
         }
         """
-        response = self._client.get(self.DISPLAYS.format(display_id))
+        response = self._client.get(_format_url(self.DISPLAYS, display_id))
         response_json = self._check_response(response)
         return response_json["result"]
 
@@ -108,7 +228,7 @@ class PortalHTTP:
         :return: 层级结构JSON字符串或XML字符串
         """
         params = {"format": format}
-        response = self._client.get(self.HIERARCHY.format(display_id), params=params)
+        response = self._client.get(_format_url(self.HIERARCHY, display_id), params=params)
         if format == "xml":
             return response.content.decode("utf-8")
         else:
@@ -118,6 +238,36 @@ class PortalHTTP:
             else:
                 raise ValueError(response_json["message"])
 
+    def get_hierarchy_xml_bytes(self, display_id: int) -> bytes:
+        """
+        获取指定display_id的XML层级结构原始字节
+
+        供lxml直接解析，跳过decode再encode的两次无谓拷贝
+
+        :param display_id: 显示ID
+        :return: XML字节流
+        """
+        response = self._client.get(
+            _format_url(self.HIERARCHY, display_id), params={"format": "xml"}
+        )
+        return response.content
+
+    def stream_capture(self, display_id: int) -> httpx.Response:
+        """
+        发起截图请求并返回未读取响应体的流式响应
+
+        请求在当前线程发出（截图内容在服务端此刻生成），
+        响应体可由调用方分块读取后写盘，峰值内存与图像大小无关；
+        调用方负责读完后close响应
+
+        :param display_id: 显示ID
+        :return: 流式httpx.Response响应对象
+        """
+        request = self._client.build_request("GET", _format_url(self.CAPTURE, display_id))
+        response = self._client.send(request, stream=True)
+        response.raise_for_status()
+        return response
+
     def get_capture(self, display_id: int) -> bytes:
         """
         获取指定display_id的截图
@@ -125,7 +275,7 @@ class PortalHTTP:
         :param display_id: 显示ID
         :return: 截图字节流
         """
-        response = self._client.get(self.CAPTURE.format(display_id))
+        response = self._client.get(_format_url(self.CAPTURE, display_id))
         return response.content
 
     def action_tap(self, display_id: int, point: Point, duration: int = 100):
@@ -137,7 +287,7 @@ class PortalHTTP:
         :param duration: 点击时间，默认100ms
         """
         params = {"x": point.x, "y": point.y, "duration": duration}
-        response = self._client.get(self.TAP.format(display_id), params=params)
+        response = self._client.get(_format_url(self.TAP, display_id), params=params)
         response.raise_for_status()
 
     def action_long_press(self, display_id: int, point: Point, duration: int = 1000):
@@ -149,7 +299,21 @@ class PortalHTTP:
         :param duration: 长按时间，默认1000ms
         """
         params = {"x": point.x, "y": point.y, "duration": duration}
-        response = self._client.get(self.LONG_PRESS.format(display_id), params=params)
+        response = self._client.get(_format_url(self.LONG_PRESS, display_id), params=params)
+        response.raise_for_status()
+
+    def action_batch(self, display_id: int, actions: list[dict]):
+        """
+        在指定display_id批量执行手势
+
+        一次POST提交多个手势，由Portal服务端按顺序执行，
+        避免逐个手势的HTTP往返开销
+
+        :param display_id: 显示ID
+        :param actions: 手势列表，如 [{"type": "tap", "x": 1, "y": 2, "duration": 100}]
+        """
+        data = {"actions": actions}
+        response = self._post_json(_format_url(self.BATCH, display_id), data)
         response.raise_for_status()
 
     def action_swipe(
@@ -174,7 +338,7 @@ class PortalHTTP:
             "endY": end.y,
             "duration": duration,
         }
-        response = self._client.get(self.SWIPE.format(display_id), params=params)
+        response = self._client.get(_format_url(self.SWIPE, display_id), params=params)
         response.raise_for_status()
 
     def action_zoom(self, display_id: int, action_type: str = "in"):
@@ -186,7 +350,7 @@ class PortalHTTP:
         :param duration: 缩放时间，默认1000ms
         """
         params = {"type": action_type}
-        response = self._client.get(self.ZOOM.format(display_id), params=params)
+        response = self._client.get(_format_url(self.ZOOM, display_id), params=params)
         response.raise_for_status()
 
     def action_custom_zoom(
@@ -220,7 +384,7 @@ class PortalHTTP:
             },
             "duration": duration,
         }
-        response = self._client.post(self.ZOOM.format(display_id), json=data)
+        response = self._post_json(_format_url(self.ZOOM, display_id), data)
         response.raise_for_status()
 
     def action_input_text(self, display_id: int, content: str):
@@ -233,7 +397,7 @@ class PortalHTTP:
         data = {"text": content}
         check = False
         for _ in range(3):
-            response = self._client.post(self.INPUT_TEXT.format(display_id), json=data)
+            response = self._post_json(_format_url(self.INPUT_TEXT, display_id), data)
             if response.status_code == 200:
                 response_json = response.json()
                 if response_json["success"]:
@@ -251,7 +415,7 @@ class PortalHTTP:
         """
         check = False
         for _ in range(3):
-            response = self._client.get(self.CLEAR_INPUT.format(display_id))
+            response = self._client.get(_format_url(self.CLEAR_INPUT, display_id))
             if response.status_code == 200:
                 response_json = response.json()
                 if response_json["success"]:
@@ -294,7 +458,7 @@ class PortalHTTP:
             "direction": direction,
             "maxRetries": max_retries,
         }
-        response = self._client.post(self.SEARCH.format(display_id), json=data)
+        response = self._post_json(_format_url(self.SEARCH, display_id), data)
         response.raise_for_status()
 
     def get_notifications(self, display_id: int):
@@ -303,7 +467,7 @@ class PortalHTTP:
 
         :param display_id: 显示ID
         """
-        response = self._client.get(self.NOTIFICATIONS.format(display_id))
+        response = self._client.get(_format_url(self.NOTIFICATIONS, display_id))
         response.raise_for_status()
         return response.json()["result"]
 
@@ -320,7 +484,7 @@ class PortalHTTP:
         """
         params = {"title": title, "content": content, "duration": duration}
         response = self._client.get(
-            self.TRIGGER_NOTIFICATION.format(display_id), params=params
+            _format_url(self.TRIGGER_NOTIFICATION, display_id), params=params
         )
         response.raise_for_status()
         return response.json()["result"]
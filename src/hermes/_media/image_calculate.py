@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
@@ -67,9 +68,9 @@ def find_all_templates(
             MatchMethod.FEATURE,
         ]
 
-    # 加载图片
+    # 加载图片（模板走解码缓存，截图每次都是新文件）
     resource_img = _load_image(resource_path)
-    template_img = _load_image(template_path)
+    template_img = _load_template(template_path)
 
     if resource_img is None or template_img is None:
         return []
@@ -110,6 +111,31 @@ def _load_image(path: Path) -> np.ndarray | None:
     return img
 
 
+@lru_cache(maxsize=64)
+def _cached_template(path_str: str, mtime_ns: int) -> np.ndarray | None:
+    return _load_image(Path(path_str))
+
+
+def _load_template(path: Path) -> np.ndarray | None:
+    """加载模板图片，按（路径, 修改时间）缓存解码结果
+
+    图像定位的轮询会反复匹配同一个模板，缓存省去每次轮询的
+    磁盘读取和解码；模板文件被修改后 mtime 变化自动失效
+
+    Args:
+        path: 模板图片路径
+
+    Returns:
+        OpenCV 图片对象，如果加载失败返回 None
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        print(f"警告: 无法加载图片 {path}")
+        return None
+    return _cached_template(str(path), mtime_ns)
+
+
 def _template_matching(
     resource_img: np.ndarray,
     template_img: np.ndarray,
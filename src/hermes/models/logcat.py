@@ -1,8 +1,14 @@
 from datetime import datetime
+from typing import NamedTuple
 
-from pydantic import BaseModel
 
+class LogcatItem(NamedTuple):
+    """A parsed logcat entry.
+
+    Kept as a NamedTuple rather than a pydantic model: entries are built at
+    device log rates, where per-line validator dispatch would dominate the
+    parse path.
+    """
 
-class LogcatItem(BaseModel):
     timestamp: datetime
     message: str
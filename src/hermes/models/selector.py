@@ -1,7 +1,7 @@
 from enum import Enum
 from pathlib import Path
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .language import Language
 from .media import MatchMethod
@@ -32,11 +32,15 @@ class Method(Enum):
 
 
 class Window(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = "default"
     display_id: int = 0
 
 
 class MultiLanguageSelector(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     chinese: str | None = None
     chinese_traditional: str | None = None
     english: str | None = None
@@ -50,12 +54,16 @@ class MultiLanguageSelector(BaseModel):
 
 
 class ImageSelector(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     path: Path
     threshold: float = 0.9
     method: MatchMethod | None = None
 
 
 class MultiLanguageImageSelector(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     chinese: ImageSelector | None = None
     chinese_traditional: ImageSelector | None = None
     english: ImageSelector | None = None
@@ -69,6 +77,8 @@ class MultiLanguageImageSelector(BaseModel):
 
 
 class Selector(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: MultiLanguageSelector | str | None = None
     text: MultiLanguageSelector | str | None = None
     description: MultiLanguageSelector | str | None = None
@@ -8,6 +8,8 @@ from ..models.selector import Window, Selector, SelectorKey
 
 
 class ComponentProtocol(Protocol):
+    __slots__ = ()
+
     def get_window(self) -> Window | None: ...
 
     def get_text(self) -> str | None: ...
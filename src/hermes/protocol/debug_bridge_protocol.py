@@ -1,10 +1,10 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import Literal, Protocol
 from subprocess import CompletedProcess
 
-from ..models.common import PopenOutput
 from ..models.component import Bounds, Point, Size
+from ..models.logcat import LogcatItem
 
 
 class DebugBridgeProtocol(Protocol):
@@ -28,13 +28,20 @@ class DebugBridgeProtocol(Protocol):
 
     def stop_logcat(self): ...
 
+    def iter_logcat(self) -> Iterator[LogcatItem]: ...
+
     def reboot(self, wait_for_boot_completed: bool = True, timeout: int = 60000): ...
 
     def wait_for_boot_completed(self, timeout: int = 60000) -> bool: ...
 
     def get_devices(self) -> list[str]: ...
 
-    def screenshot(self, path: Path | None, display_id: str | None = None) -> Path: ...
+    def screenshot(
+        self,
+        path: Path | None,
+        display_id: str | None = None,
+        timeout: int = 30000,
+    ) -> Path: ...
 
     def click_back(self): ...
 
@@ -90,11 +97,20 @@ class DebugBridgeProtocol(Protocol):
 
     def start_app(self, package_name: str, activity_name: str | None = None): ...
 
+    def start_app_and_wait(
+        self,
+        package_name: str,
+        activity_name: str | None = None,
+        timeout: int = 15000,
+    ) -> bool: ...
+
     def stop_app(self, package_name: str): ...
 
-    def get_app_info(self, package_name: str) -> str: ...
+    def get_app_info(self, package_name: str, refresh: bool = False) -> str: ...
 
-    def get_app_version(self, package_name: str) -> str | None: ...
+    def get_app_version(
+        self, package_name: str, refresh: bool = False
+    ) -> str | None: ...
 
     def query_content(self, uri: str) -> str: ...
 
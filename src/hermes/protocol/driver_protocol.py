@@ -1,7 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Literal, Protocol, overload
-from xml.etree import ElementTree
+from lxml import etree as ElementTree
 from ..models.component import Bounds, Point, Size
 from ..models.language import Language
 from ..models.selector import Selector, SelectorKey
@@ -15,10 +15,12 @@ class DriverProtocol(Protocol):
 
     def get_json_tree(self, display_id: int) -> dict: ...
 
-    def get_xml_element_tree(self, display_id: int) -> ElementTree.Element: ...
+    def get_xml_element_tree(self, display_id: int) -> ElementTree._Element: ...
 
     def get_window_size(self) -> Size: ...
 
+    def invalidate_window_size(self): ...
+
     def tap(self, target: ComponentProtocol | Selector | Point): ...
 
     def long_press(
@@ -43,6 +45,15 @@ class DriverProtocol(Protocol):
         language: Language | None = None,
     ) -> Sequence[ComponentProtocol]: ...
 
+    def locators_iter(
+        self,
+        selector: Selector,
+        *,
+        visible: bool = True,
+        combination: Sequence[SelectorKey] | None = None,
+        language: Language | None = None,
+    ) -> Iterator[ComponentProtocol]: ...
+
     def scroll_into_view(
         self,
         target: Selector,
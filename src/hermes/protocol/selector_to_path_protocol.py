@@ -9,3 +9,4 @@ class SelectorToPathProtocol(Protocol):
     def get_method(self) -> Method: ...
     def get_threshold(self) -> float: ...
     def get_image(self) -> Path: ...
+    def get_fast_key(self) -> tuple[str, str] | None: ...
@@ -1,2 +1,29 @@
+import time
+
+from itertools import count
+
+_TS_FORMAT = "%Y-%m-%d_%H-%M-%S"
+_ts_cache: tuple[int, str] = (-1, "")
+_ts_counter = count()
+
+
 def parse_url(base_url: str, path: str) -> str:
     return base_url + path
+
+
+def timestamp() -> str:
+    """
+    Formatted wall-clock stamp for artifact file names.
+
+    strftime is surprisingly costly when screenshots burst within the same
+    second, so the formatted string is cached per second; a monotonic counter
+    suffix keeps sub-second names unique.
+
+    Returns:
+        str: Stamp like "2026-08-29_10-30-05-17"
+    """
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime(_TS_FORMAT, time.localtime(now)))
+    return f"{_ts_cache[1]}-{next(_ts_counter)}"
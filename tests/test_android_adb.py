@@ -0,0 +1,67 @@
+from pathlib import Path
+from unittest import mock
+
+from hermes._android.android_adb import AndroidADB
+from hermes.models.component import Point
+
+
+class TestAndroidADB:
+    adb = AndroidADB("dummy-serial")
+
+    def test_parse_logcat_item(self):
+        """测试logcat -v year固定布局行的解析"""
+        raw = b"2025-01-02 03:04:05.678  1234  5678 I ActivityManager: Start proc"
+        item = self.adb._parse_logcat_item(raw)
+        assert item is not None
+        assert item.timestamp.year == 2025
+        assert item.timestamp.month == 1
+        assert item.timestamp.day == 2
+        assert item.timestamp.hour == 3
+        assert item.timestamp.minute == 4
+        assert item.timestamp.second == 5
+        assert item.timestamp.microsecond == 678000
+        assert "ActivityManager" in item.message
+
+    def test_parse_logcat_item_invalid_line(self):
+        """测试无时间戳的logcat行返回None"""
+        assert self.adb._parse_logcat_item(b"--------- beginning of main") is None
+
+    def test_pull_many_groups_by_directory(self):
+        """测试pull_many按目标目录合并拉取，重命名目标单独拉取"""
+        mapping = {
+            "/sdcard/a.png": Path("/tmp/out/a.png"),
+            "/sdcard/b.png": Path("/tmp/out/b.png"),
+            "/sdcard/c.png": Path("/tmp/out/renamed.png"),
+        }
+        with (
+            mock.patch.object(self.adb, "cmd") as cmd,
+            mock.patch.object(self.adb, "pull") as pull,
+        ):
+            self.adb.pull_many(mapping)
+        # 同目录同名的文件合并为一次pull调用
+        cmd.assert_called_once_with("pull /sdcard/a.png /sdcard/b.png /tmp/out")
+        # 重命名的文件走单独的pull
+        pull.assert_called_once_with("/sdcard/c.png", Path("/tmp/out/renamed.png"))
+
+    def test_cmd_many_empty(self):
+        """测试空命令列表直接返回空结果"""
+        assert self.adb.cmd_many([]) == []
+
+    def test_shell_empty_command(self):
+        """测试空命令不进入持久会话，直接返回成功结果"""
+        result = self.adb.shell("")
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert self.adb._shell_process is None
+
+    def test_run_batch_empty(self):
+        """测试空批量命令不触发任何shell调用"""
+        result = self.adb.run_batch([])
+        assert result.returncode == 0
+        assert self.adb._shell_process is None
+
+    def test_swipe_zero_repeat(self):
+        """测试repeat=0的滑动是无操作"""
+        with mock.patch.object(self.adb, "shell") as shell:
+            self.adb.swipe(Point(x=0, y=0), Point(x=10, y=10), repeat=0)
+        shell.assert_not_called()
@@ -471,3 +471,53 @@ class TestSelectorToXpath:
             assert False, "Should have raised ValueError"
         except ValueError as e:
             assert "Invalid image selector" in str(e)
+
+    def test_fast_key_for_exact_attribute_selectors(self):
+        """测试单一精确属性选择器提取fast key"""
+        parser = SelectorToXpath(Selector(id="com.example:id/button"), Language.ENGLISH)
+        assert parser.get_fast_key() == ("resource-id", "com.example:id/button")
+
+        parser = SelectorToXpath(Selector(text="Click Me"), Language.ENGLISH)
+        assert parser.get_fast_key() == ("text", "Click Me")
+
+        parser = SelectorToXpath(Selector(description="Submit button"), Language.ENGLISH)
+        assert parser.get_fast_key() == ("content-desc", "Submit button")
+
+    def test_fast_key_with_multi_language(self):
+        """测试多语言选择器提取fast key时取对应语言的值"""
+        selector = Selector(
+            text=MultiLanguageSelector(english="Click Me", chinese="点击我")
+        )
+        parser = SelectorToXpath(selector, Language.CHINESE)
+        assert parser.get_fast_key() == ("text", "点击我")
+
+    def test_no_fast_key_for_complex_selectors(self):
+        """测试复杂选择器不产生fast key"""
+        # 模糊匹配选择器
+        parser = SelectorToXpath(Selector(text_starts_with="Click"), Language.ENGLISH)
+        assert parser.get_fast_key() is None
+
+        # CLASS_NAME选择器
+        parser = SelectorToXpath(
+            Selector(class_name="android.widget.Button"), Language.ENGLISH
+        )
+        assert parser.get_fast_key() is None
+
+        # XPATH选择器
+        parser = SelectorToXpath(
+            Selector(xpath="//android.widget.Button"), Language.ENGLISH
+        )
+        assert parser.get_fast_key() is None
+
+        # IMAGE选择器
+        parser = SelectorToXpath(
+            Selector(image=ImageSelector(path=Path("test.png"))), Language.ENGLISH
+        )
+        assert parser.get_fast_key() is None
+
+        # 多键组合选择器
+        selector = Selector(id="com.example:id/button", text="Click Me")
+        parser = SelectorToXpath(
+            selector, Language.ENGLISH, combination=[SelectorKey.ID, SelectorKey.TEXT]
+        )
+        assert parser.get_fast_key() is None
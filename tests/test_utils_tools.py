@@ -0,0 +1,14 @@
+import re
+
+from hermes.utils.tools import timestamp
+
+
+def test_timestamp_format():
+    """测试timestamp的格式为日期时间加计数器后缀"""
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}-\d+", timestamp())
+
+
+def test_timestamp_unique_within_same_second():
+    """测试同一秒内连续调用生成的文件名不重复"""
+    stamps = {timestamp() for _ in range(100)}
+    assert len(stamps) == 100